@@ -1,67 +1,191 @@
+from __future__ import annotations
 import os
 import logging
+from typing import Any, Callable, ClassVar
+from pathlib import Path
+from functools import lru_cache
+from dataclasses import dataclass
 
-from dotenv import find_dotenv, load_dotenv
+from dotenv import load_dotenv
 
 
 logger = logging.getLogger(__name__)
 
-# Locate .env file (search upward from current working directory)
-dotenv_path = find_dotenv(usecwd=True)
+# Project root (one level above the package), where `.env.example` is copied to `.env`
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
-if dotenv_path:
-    # Load .env and override environment variables
-    load_dotenv(dotenv_path=dotenv_path, override=True)
-    logger.info(f"Configuration loaded from {dotenv_path}")
-else:
-    logger.warning("No .env file found, using environment variables")
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
 
 
+def _find_dotenv_path() -> str | None:
+    """Return the .env file to load from a fixed list of locations.
+
+    Checks ``REACHY_DOTENV_PATH`` (for non-standard layouts), then the current
+    working directory, then the project root. Unlike ``find_dotenv`` this
+    never walks up the directory tree.
+    """
+    explicit = os.environ.get("REACHY_DOTENV_PATH")
+    candidates = [Path(explicit)] if explicit else [Path.cwd() / ".env", PROJECT_ROOT / ".env"]
+    for candidate in candidates:
+        if candidate.is_file():
+            return str(candidate)
+    return None
+
+
+@lru_cache(maxsize=1)
+def _load_dotenv_once() -> str | None:
+    """Locate and load the .env file, at most once per process.
+
+    Variables already present in the environment take precedence over the
+    file, so values set by the shell (or by a previous load) stay stable.
+
+    Setting ``REACHY_SKIP_DOTENV`` (e.g. in containers where the orchestrator
+    provides every variable) skips the file lookup entirely.
+
+    Returns:
+        Path of the loaded .env file, or None if none was found or skipped.
+
+    """
+    if os.environ.get("REACHY_SKIP_DOTENV", "").strip().lower() in _TRUE_VALUES:
+        logger.info("REACHY_SKIP_DOTENV set, using environment variables only")
+        return None
+    path = _find_dotenv_path()
+    if not path:
+        logger.warning("No .env file found, using environment variables")
+        return None
+    load_dotenv(dotenv_path=path, override=False)
+    logger.info("Configuration loaded from %s", path)
+    return path
+
+
+dotenv_path = _load_dotenv_once()
+
+# Environment keys shared by the Config build and the runtime setters
+_K_PROF = "REACHY_MINI_CUSTOM_PROFILE"
+
+# Plain-dict snapshot of the environment, taken once after .env is loaded
+_env = dict(os.environ)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean from the environment snapshot, returning `default` untouched when unset."""
+    value = _env.get(name)
+    return default if value is None else value.strip().lower() in _TRUE_VALUES
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer from the environment snapshot, returning `default` when unset or malformed."""
+    value = _env.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Invalid integer %s=%r, using default %d", name, value, default)
+        return default
+
+
+# Fields only some subsystems (vision, memory, idle signals) read; resolved on first access
+_LAZY_FIELDS: dict[str, Callable[[], Any]] = {
+    "HF_HOME": lambda: _env.get("HF_HOME", "./cache"),
+    "LOCAL_VISION_MODEL": lambda: _env.get("LOCAL_VISION_MODEL", "HuggingFaceTB/SmolVLM2-2.2B-Instruct"),
+    "HF_TOKEN": lambda: _env.get("HF_TOKEN"),
+    "SUPERMEMORY_API_KEY": lambda: _env.get("SUPERMEMORY_API_KEY"),
+    "ENABLE_IDLE_SIGNALS": lambda: _env_bool("ENABLE_IDLE_SIGNALS", True),
+    "IDLE_SIGNAL_TIMEOUT": lambda: _env_int("IDLE_SIGNAL_TIMEOUT", 300),  # Default 5 minutes
+}
+
+
+@dataclass(slots=True, init=False, repr=False, eq=False)
 class Config:
-    """Configuration class for Reachy Language Partner."""
+    """Configuration class for Reachy Language Partner.
+
+    ``Config()`` always returns the same process-wide instance; hot fields are
+    resolved from the environment the first time it is built. Fields listed in
+    ``_LAZY_FIELDS`` are left unset and resolved (then stored in their slot) on
+    first access. Fields stay assignable because the settings UIs update keys
+    and idle settings at runtime. No ``__repr__`` or ``__eq__`` is generated:
+    a repr would print the API keys and resolve every lazy field.
+    """
+
+    _instance: ClassVar[Config | None] = None
 
     # Required
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # The key is downloaded in console.py if needed
+    OPENAI_API_KEY: str | None  # The key is downloaded in console.py if needed
 
     # Optional
-    MODEL_NAME = os.getenv("MODEL_NAME", "gpt-realtime")
-    HF_HOME = os.getenv("HF_HOME", "./cache")
-    LOCAL_VISION_MODEL = os.getenv("LOCAL_VISION_MODEL", "HuggingFaceTB/SmolVLM2-2.2B-Instruct")
-    HF_TOKEN = os.getenv("HF_TOKEN")  # Optional, falls back to hf auth login if not set
-
-    # Memory (SuperMemory.AI)
-    SUPERMEMORY_API_KEY = os.getenv("SUPERMEMORY_API_KEY")
+    MODEL_NAME: str
+    REACHY_MINI_CUSTOM_PROFILE: str | None
 
-    logger.debug(f"Model: {MODEL_NAME}, HF_HOME: {HF_HOME}, Vision Model: {LOCAL_VISION_MODEL}")
+    HF_HOME: str
+    LOCAL_VISION_MODEL: str
+    HF_TOKEN: str | None  # Optional, falls back to hf auth login if not set
 
-    REACHY_MINI_CUSTOM_PROFILE = os.getenv("REACHY_MINI_CUSTOM_PROFILE")
-    logger.debug(f"Custom Profile: {REACHY_MINI_CUSTOM_PROFILE}")
+    # Memory (SuperMemory.AI)
+    SUPERMEMORY_API_KEY: str | None
 
     # Idle signal configuration (cost optimization)
-    ENABLE_IDLE_SIGNALS = os.getenv("ENABLE_IDLE_SIGNALS", "true").lower() == "true"
-    IDLE_SIGNAL_TIMEOUT = int(os.getenv("IDLE_SIGNAL_TIMEOUT", "300"))  # Default 5 minutes
+    ENABLE_IDLE_SIGNALS: bool
+    IDLE_SIGNAL_TIMEOUT: int  # Seconds
+
+    def __new__(cls) -> Config:
+        """Return the shared instance, building it on first use."""
+        if cls._instance is None:
+            instance = object.__new__(cls)
+            instance._init()
+            cls._instance = instance
+        return cls._instance
+
+    def _init(self) -> None:
+        """Resolve the hot fields from the environment snapshot."""
+        self.OPENAI_API_KEY = _env.get("OPENAI_API_KEY")
+        self.MODEL_NAME = _env.get("MODEL_NAME", "gpt-realtime")
+        self.REACHY_MINI_CUSTOM_PROFILE = _env.get(_K_PROF)
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolve a lazy field on first access (only called while its slot is unset)."""
+        factory = _LAZY_FIELDS.get(name)
+        if factory is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = factory()
+        setattr(self, name, value)
+        return value
 
 
 config = Config()
+logger.debug("Model: %s, Custom Profile: %s", config.MODEL_NAME, config.REACHY_MINI_CUSTOM_PROFILE)
+
+
+def apply_config_updates(updates: dict[str, Any]) -> None:
+    """Set config fields and mirror them into ``os.environ`` in one pass.
+
+    Keys are both ``Config`` field names and environment variable names.
+    Booleans are exported as ``true``/``false``; ``None`` or an empty string
+    removes the variable from the environment.
+    """
+    env = os.environ
+    for key, value in updates.items():
+        setattr(config, key, value)
+        if value is None or value == "":
+            if key in env:
+                del env[key]
+        elif isinstance(value, bool):
+            env[key] = "true" if value else "false"
+        else:
+            env[key] = str(value)
 
 
 def set_custom_profile(profile: str | None) -> None:
     """Update the selected custom profile at runtime and expose it via env.
 
     This ensures modules that read `config` and code that inspects the
-    environment see a consistent value.
+    environment see a consistent value. Surrounding whitespace is stripped
+    and a blank name selects the default profile.
     """
-    try:
-        config.REACHY_MINI_CUSTOM_PROFILE = profile
-    except Exception:
-        pass
-    try:
-        import os as _os
-
-        if profile:
-            _os.environ["REACHY_MINI_CUSTOM_PROFILE"] = profile
-        else:
-            # Remove to reflect default
-            _os.environ.pop("REACHY_MINI_CUSTOM_PROFILE", None)
-    except Exception:
-        pass
+    if profile is not None and not isinstance(profile, str):
+        logger.warning("Ignoring non-string profile %r", profile)
+        return
+    if profile is not None:
+        # Normalize once here so readers never need to strip; blank means default
+        profile = profile.strip() or None
+    apply_config_updates({_K_PROF: profile})
@@ -16,13 +16,16 @@ import asyncio
 import logging
 from typing import List, Optional
 from pathlib import Path
+from urllib.parse import quote
 
+from dotenv import load_dotenv
 from fastrtc import AdditionalOutputs, audio_to_float32
 from scipy.signal import resample
 
 from reachy_mini import ReachyMini
 from reachy_mini.media.media_manager import MediaBackend
-from reachy_mini_language_tutor.config import config
+from reachy_mini_language_tutor.config import config, apply_config_updates
+from reachy_mini_language_tutor.env_file import read_env_lines, find_env_template, persist_env_updates
 from reachy_mini_language_tutor.openai_realtime import OpenaiRealtimeHandler
 from reachy_mini_language_tutor.headless_personality_ui import mount_personality_routes
 
@@ -72,39 +75,19 @@ class LocalStream:
         self._asyncio_loop = None
 
     # ---- Settings UI (only when API key is missing) ----
-    def _read_env_lines(self, env_path: Path) -> list[str]:
-        """Load env file contents or a template as a list of lines."""
-        inst = env_path.parent
+    def _persist_env_values(self, updates: dict[str, Optional[str]]) -> None:
+        """Write several keys to the instance ``.env`` in one read and one write.
+
+        Each key replaces the first line assigning it (or is appended); a ``None``
+        value removes that line instead.
+        """
+        if not self._instance_path or not updates:
+            return
         try:
-            if env_path.exists():
-                try:
-                    return env_path.read_text(encoding="utf-8").splitlines()
-                except Exception:
-                    return []
-            template_text = None
-            ex = inst / ".env.example"
-            if ex.exists():
-                try:
-                    template_text = ex.read_text(encoding="utf-8")
-                except Exception:
-                    template_text = None
-            if template_text is None:
-                try:
-                    cwd_example = Path.cwd() / ".env.example"
-                    if cwd_example.exists():
-                        template_text = cwd_example.read_text(encoding="utf-8")
-                except Exception:
-                    template_text = None
-            if template_text is None:
-                packaged = Path(__file__).parent / ".env.example"
-                if packaged.exists():
-                    try:
-                        template_text = packaged.read_text(encoding="utf-8")
-                    except Exception:
-                        template_text = None
-            return template_text.splitlines() if template_text else []
-        except Exception:
-            return []
+            env_path = Path(self._instance_path) / ".env"
+            persist_env_updates(env_path, read_env_lines(env_path, find_env_template(self._instance_path)), updates)
+        except Exception as e:
+            logger.warning("Failed to persist %s: %s", ", ".join(updates), e)
 
     def _persist_api_key(self, key: str) -> None:
         """Persist API key to environment and instance ``.env`` if possible.
@@ -117,48 +100,13 @@ class LocalStream:
             otherwise falls back to the packaged template
             ``reachy_mini_language_tutor/.env.example``.
           * Ensures the resulting file contains the full template plus the key.
-        - Loads the written ``.env`` into the current process environment.
         """
         k = (key or "").strip()
         if not k:
             return
         # Update live process env and config so consumers see it immediately
-        try:
-            os.environ["OPENAI_API_KEY"] = k
-        except Exception:  # best-effort
-            pass
-        try:
-            config.OPENAI_API_KEY = k
-        except Exception:
-            pass
-
-        if not self._instance_path:
-            return
-        try:
-            inst = Path(self._instance_path)
-            env_path = inst / ".env"
-            lines = self._read_env_lines(env_path)
-            replaced = False
-            for i, ln in enumerate(lines):
-                if ln.strip().startswith("OPENAI_API_KEY="):
-                    lines[i] = f"OPENAI_API_KEY={k}"
-                    replaced = True
-                    break
-            if not replaced:
-                lines.append(f"OPENAI_API_KEY={k}")
-            final_text = "\n".join(lines) + "\n"
-            env_path.write_text(final_text, encoding="utf-8")
-            logger.info("Persisted OPENAI_API_KEY to %s", env_path)
-
-            # Load the newly written .env into this process to ensure downstream imports see it
-            try:
-                from dotenv import load_dotenv
-
-                load_dotenv(dotenv_path=str(env_path), override=True)
-            except Exception:
-                pass
-        except Exception as e:
-            logger.warning("Failed to persist OPENAI_API_KEY: %s", e)
+        apply_config_updates({"OPENAI_API_KEY": k})
+        self._persist_env_values({"OPENAI_API_KEY": k})
 
     def _persist_personality(self, profile: Optional[str]) -> None:
         """Persist the startup personality to the instance .env and config."""
@@ -170,132 +118,23 @@ class LocalStream:
         except Exception:
             pass
 
-        if not self._instance_path:
+        # Clearing the selection never needs to create a .env
+        if not self._instance_path or (selection is None and not (Path(self._instance_path) / ".env").exists()):
             return
-        try:
-            env_path = Path(self._instance_path) / ".env"
-            lines = self._read_env_lines(env_path)
-            replaced = False
-            for i, ln in enumerate(list(lines)):
-                if ln.strip().startswith("REACHY_MINI_CUSTOM_PROFILE="):
-                    if selection:
-                        lines[i] = f"REACHY_MINI_CUSTOM_PROFILE={selection}"
-                    else:
-                        lines.pop(i)
-                    replaced = True
-                    break
-            if selection and not replaced:
-                lines.append(f"REACHY_MINI_CUSTOM_PROFILE={selection}")
-            if selection is None and not env_path.exists():
-                return
-            final_text = "\n".join(lines) + "\n"
-            env_path.write_text(final_text, encoding="utf-8")
-            logger.info("Persisted startup personality to %s", env_path)
-            try:
-                from dotenv import load_dotenv
-
-                load_dotenv(dotenv_path=str(env_path), override=True)
-            except Exception:
-                pass
-        except Exception as e:
-            logger.warning("Failed to persist REACHY_MINI_CUSTOM_PROFILE: %s", e)
+        self._persist_env_values({"REACHY_MINI_CUSTOM_PROFILE": selection})
 
     def _persist_supermemory_key(self, key: str) -> None:
         """Persist SuperMemory API key to .env (no validation - optional feature)."""
         k = (key or "").strip()
         # Update live process env and config so consumers see it immediately
-        try:
-            os.environ["SUPERMEMORY_API_KEY"] = k
-        except Exception:  # best-effort
-            pass
-        try:
-            config.SUPERMEMORY_API_KEY = k
-        except Exception:
-            pass
-
-        if not self._instance_path:
-            return
-        try:
-            inst = Path(self._instance_path)
-            env_path = inst / ".env"
-            lines = self._read_env_lines(env_path)
-            replaced = False
-            for i, ln in enumerate(lines):
-                if ln.strip().startswith("SUPERMEMORY_API_KEY="):
-                    lines[i] = f"SUPERMEMORY_API_KEY={k}"
-                    replaced = True
-                    break
-            if not replaced:
-                lines.append(f"SUPERMEMORY_API_KEY={k}")
-            final_text = "\n".join(lines) + "\n"
-            env_path.write_text(final_text, encoding="utf-8")
-            logger.info("Persisted SUPERMEMORY_API_KEY to %s", env_path)
-
-            # Load the newly written .env into this process
-            try:
-                from dotenv import load_dotenv
-
-                load_dotenv(dotenv_path=str(env_path), override=True)
-            except Exception:
-                pass
-        except Exception as e:
-            logger.warning("Failed to persist SUPERMEMORY_API_KEY: %s", e)
+        apply_config_updates({"SUPERMEMORY_API_KEY": k})
+        self._persist_env_values({"SUPERMEMORY_API_KEY": k})
 
     def _persist_idle_settings(self, enable: bool, timeout: int) -> None:
         """Persist idle signal settings to .env."""
-        # Update config immediately (applies to current session)
-        try:
-            config.ENABLE_IDLE_SIGNALS = enable
-            config.IDLE_SIGNAL_TIMEOUT = timeout
-        except Exception:
-            pass
-
-        # Update process env as well
-        try:
-            os.environ["ENABLE_IDLE_SIGNALS"] = str(enable).lower()
-            os.environ["IDLE_SIGNAL_TIMEOUT"] = str(timeout)
-        except Exception:
-            pass
-
-        if not self._instance_path:
-            return
-        try:
-            env_path = Path(self._instance_path) / ".env"
-            lines = self._read_env_lines(env_path)
-
-            # Update ENABLE_IDLE_SIGNALS
-            enable_replaced = False
-            for i, ln in enumerate(lines):
-                if ln.strip().startswith("ENABLE_IDLE_SIGNALS="):
-                    lines[i] = f"ENABLE_IDLE_SIGNALS={str(enable).lower()}"
-                    enable_replaced = True
-                    break
-            if not enable_replaced:
-                lines.append(f"ENABLE_IDLE_SIGNALS={str(enable).lower()}")
-
-            # Update IDLE_SIGNAL_TIMEOUT
-            timeout_replaced = False
-            for i, ln in enumerate(lines):
-                if ln.strip().startswith("IDLE_SIGNAL_TIMEOUT="):
-                    lines[i] = f"IDLE_SIGNAL_TIMEOUT={timeout}"
-                    timeout_replaced = True
-                    break
-            if not timeout_replaced:
-                lines.append(f"IDLE_SIGNAL_TIMEOUT={timeout}")
-
-            final_text = "\n".join(lines) + "\n"
-            env_path.write_text(final_text, encoding="utf-8")
-            logger.info("Persisted idle settings to %s (enable=%s, timeout=%d)", env_path, enable, timeout)
-
-            # Load the newly written .env into this process
-            try:
-                from dotenv import load_dotenv
-
-                load_dotenv(dotenv_path=str(env_path), override=True)
-            except Exception:
-                pass
-        except Exception as e:
-            logger.warning("Failed to persist idle settings: %s", e)
+        # Update config and process env immediately (applies to current session)
+        apply_config_updates({"ENABLE_IDLE_SIGNALS": enable, "IDLE_SIGNAL_TIMEOUT": timeout})
+        self._persist_env_values({"ENABLE_IDLE_SIGNALS": str(enable).lower(), "IDLE_SIGNAL_TIMEOUT": str(timeout)})
 
     def _read_persisted_personality(self) -> Optional[str]:
         """Read persisted startup personality from instance .env (if any)."""
@@ -304,7 +143,7 @@ class LocalStream:
         env_path = Path(self._instance_path) / ".env"
         try:
             if env_path.exists():
-                for ln in env_path.read_text(encoding="utf-8").splitlines():
+                for ln in env_path.read_bytes().decode("utf-8").splitlines():
                     if ln.strip().startswith("REACHY_MINI_CUSTOM_PROFILE="):
                         _, _, val = ln.partition("=")
                         v = val.strip()
@@ -386,17 +225,22 @@ class LocalStream:
             if not key:
                 return JSONResponse({"valid": False, "error": "empty_key"}, status_code=400)
 
-            # Try to validate by checking if we can fetch the models
+            # Validate by retrieving the configured model (single-object payload, not the full listing)
             try:
                 import httpx
 
                 headers = {"Authorization": f"Bearer {key}", "Content-Type": "application/json"}
                 async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get("https://api.openai.com/v1/models", headers=headers)
+                    response = await client.get(
+                        f"https://api.openai.com/v1/models/{quote(config.MODEL_NAME, safe='')}", headers=headers
+                    )
                     if response.status_code == 200:
                         return JSONResponse({"valid": True})
                     elif response.status_code == 401:
                         return JSONResponse({"valid": False, "error": "invalid_api_key"}, status_code=401)
+                    elif response.status_code in (403, 404):
+                        # The key authenticated but cannot see the configured model (custom or project-scoped)
+                        return JSONResponse({"valid": True, "warning": "model_not_accessible"})
                     else:
                         return JSONResponse(
                             {"valid": False, "error": "validation_failed"}, status_code=response.status_code
@@ -437,11 +281,7 @@ class LocalStream:
                     {"ok": False, "error": "timeout_out_of_range", "min": 30, "max": 900}, status_code=400
                 )
 
-            # Update config immediately (applies to current session)
-            config.ENABLE_IDLE_SIGNALS = enable
-            config.IDLE_SIGNAL_TIMEOUT = timeout
-
-            # Persist to .env for next restart
+            # Update config immediately and persist to .env for next restart
             self._persist_idle_settings(enable, timeout)
 
             return JSONResponse({"ok": True, "enable_idle_signals": enable, "idle_signal_timeout": timeout})
@@ -459,8 +299,6 @@ class LocalStream:
         # Try to load an existing instance .env first (covers subsequent runs)
         if self._instance_path:
             try:
-                from dotenv import load_dotenv
-
                 from reachy_mini_language_tutor.config import set_custom_profile
 
                 env_path = Path(self._instance_path) / ".env"
@@ -476,7 +314,7 @@ class LocalStream:
                     new_profile = os.getenv("REACHY_MINI_CUSTOM_PROFILE")
                     if new_profile is not None:
                         try:
-                            set_custom_profile(new_profile.strip() or None)
+                            set_custom_profile(new_profile)
                         except Exception:
                             pass
             except Exception:
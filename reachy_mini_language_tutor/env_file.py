@@ -0,0 +1,119 @@
+"""Read and update the per-instance ``.env`` file shared by the settings UIs."""
+
+from __future__ import annotations
+import os
+import stat
+import logging
+import tempfile
+import contextlib
+from typing import Mapping, Optional
+from pathlib import Path
+from functools import lru_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def find_env_template(instance_path: Optional[str]) -> Optional[Path]:
+    """Locate the .env template once per instance dir: instance dir, then cwd, then the packaged copy."""
+    candidates = [Path.cwd() / ".env.example", Path(__file__).parent / ".env.example"]
+    if instance_path:
+        candidates.insert(0, Path(instance_path) / ".env.example")
+    return next((c for c in candidates if c.is_file()), None)
+
+
+def env_file_signature(env_path: Path) -> Optional[tuple[int, int]]:
+    """Return ``(st_mtime_ns, st_size)`` for the file, or None if it does not exist."""
+    try:
+        st = env_path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def read_env_lines(env_path: Path, template_path: Optional[Path]) -> list[str]:
+    """Load env file contents, or the template when the file does not exist yet, as a list of lines."""
+    try:
+        source = env_path if env_path.exists() else template_path
+        return source.read_bytes().decode("utf-8").splitlines() if source else []
+    except Exception:
+        return []
+
+
+def update_env_lines(lines: list[str], updates: Mapping[str, Optional[str]]) -> bool:
+    """Apply updates to ``lines`` in place and return whether anything changed.
+
+    Each key replaces the first line assigning it (or is appended); a ``None``
+    value removes that line instead.
+    """
+    # Map each key to the first line that assigns it, in a single pass.
+    # Lines are not stripped: .env entries start at column 0, optionally with "export ".
+    line_index: dict[str, int] = {}
+    for i, ln in enumerate(lines):
+        if not ln or ln[0] == "#":
+            continue
+        name, sep, _ = ln.partition("=")
+        if not sep:
+            continue
+        name = name.removeprefix("export ")
+        if name in updates and name not in line_index:
+            line_index[name] = i
+
+    removed: list[int] = []
+    changed = False
+    for key, value in updates.items():
+        if value is None:
+            if key in line_index:
+                removed.append(line_index[key])
+            continue
+        new_line = f"{key}={value}"
+        if key not in line_index:
+            lines.append(new_line)
+        elif lines[line_index[key]] != new_line:
+            lines[line_index[key]] = new_line
+        else:
+            continue
+        changed = True
+    for i in sorted(removed, reverse=True):
+        del lines[i]
+    return changed or bool(removed)
+
+
+def write_env_lines(env_path: Path, lines: list[str]) -> None:
+    """Write ``lines`` to ``env_path`` atomically, keeping the existing file's permissions.
+
+    The text goes to a sibling temp file that is swapped in, so a crash never
+    leaves a truncated .env. mkstemp creates it 0600; an existing .env's mode
+    is copied over so the swap never widens it.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=env_path.parent, prefix=f".{env_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(("\n".join(lines) + "\n").encode("utf-8"))
+        if env_path.exists():
+            os.chmod(tmp_name, stat.S_IMODE(env_path.stat().st_mode))
+        os.replace(tmp_name, env_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def persist_env_updates(env_path: Path, lines: list[str], updates: Mapping[str, Optional[str]]) -> bool:
+    """Apply updates to ``lines`` and write the file if anything changed.
+
+    No dotenv reload happens here: callers apply the values to config and
+    ``os.environ`` themselves.
+
+    Returns:
+        True if the file was written.
+
+    """
+    keys = ", ".join(updates)
+    if not update_env_lines(lines, updates):
+        logger.debug("%s already up to date in %s", keys, env_path)
+        return False
+    write_env_lines(env_path, lines)
+    logger.info("Persisted %s to %s", keys, env_path)
+    return True
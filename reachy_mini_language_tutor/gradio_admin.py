@@ -8,24 +8,80 @@ This module provides a comprehensive settings interface with:
 """
 
 from __future__ import annotations
-import os
 import logging
-from typing import Any, Callable, Optional
+import threading
+from typing import TYPE_CHECKING, Any, Final, Callable, Optional
 from pathlib import Path
+from functools import lru_cache
+from dataclasses import dataclass
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
 
-import httpx
 import gradio as gr
 
-from reachy_mini_language_tutor.config import config
+from reachy_mini_language_tutor.config import config, apply_config_updates
+from reachy_mini_language_tutor.env_file import (
+    read_env_lines,
+    find_env_template,
+    env_file_signature,
+    persist_env_updates,
+)
+from reachy_mini_language_tutor.tutor_metadata import METADATA_PATH, load_metadata
 from reachy_mini_language_tutor.headless_personality import (
     DEFAULT_OPTION,
     list_personalities,
 )
 
 
+if TYPE_CHECKING:
+    import httpx
+
+
 logger = logging.getLogger(__name__)
 
 
+# Static markup for the admin title; only the accent colour, flag and name vary per tutor
+_TITLE_TEMPLATE: Final[str] = """
+        <h1 style="
+            font-family: 'Outfit', system-ui, sans-serif;
+            font-size: clamp(1.5rem, 4vw, 2.5rem);
+            font-weight: 700;
+            letter-spacing: -0.02em;
+            background: linear-gradient(135deg, {accent} 0%, {accent_faded} 100%);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            background-clip: text;
+            margin: 0;
+            padding: 8px 0;
+            text-align: center;
+        ">
+            {flag} {name}
+        </h1>
+        """
+
+
+@lru_cache(maxsize=32)
+def _render_title_html(accent: str, flag: str, name: str) -> str:
+    """Fill the title template; keyed on primitives so repeat renders are a cache hit."""
+    return _TITLE_TEMPLATE.format_map({"accent": accent, "accent_faded": f"{accent}99", "flag": flag, "name": name})
+
+
+@dataclass(slots=True)
+class _AdminState:
+    """Mutable per-instance admin state (key flags and lazily built caches)."""
+
+    openai_configured: bool = False
+    supermemory_configured: bool = False
+    http_client: Optional[httpx.AsyncClient] = None
+    profile_choices: Optional[list[str]] = None
+    # In-memory mirror of the instance .env, read on first persist and kept in sync with each write
+    env_lines: Optional[list[str]] = None
+    # (mtime_ns, size) of the .env when the mirror was last synced; a mismatch means it was edited externally
+    env_signature: Optional[tuple[int, int]] = None
+    # Single worker that serializes .env writes off the click path
+    persist_executor: Optional[ThreadPoolExecutor] = None
+
+
 class GradioAdminUI:
     """Container for all admin interface components."""
 
@@ -54,8 +110,15 @@ class GradioAdminUI:
         self._on_profile_change = on_profile_change
 
         # Profile metadata
-        self._metadata_path = Path(__file__).parent / "profile_metadata.json"
-        self.tutor_metadata = self._load_metadata()
+        self._metadata_path = METADATA_PATH
+        self.tutor_metadata = load_metadata(str(self._metadata_path))
+        # Key state is read from config once here; the save handlers keep it current afterwards
+        self._s = _AdminState(
+            openai_configured=self._is_set(config.OPENAI_API_KEY),
+            supermemory_configured=self._is_set(config.SUPERMEMORY_API_KEY),
+        )
+        # Guards env_lines against direct persists racing the background writer
+        self._env_lock = threading.Lock()
 
         # Components (initialized in create_components)
         # All components are flat - no nested contexts for Gradio 5.x compatibility
@@ -76,57 +139,33 @@ class GradioAdminUI:
         self.idle_save_btn: gr.Button
         self.idle_status: gr.Markdown
 
-    def _load_metadata(self) -> dict[str, Any]:
-        """Load tutor metadata from JSON file."""
-        import json
+    @staticmethod
+    def _is_set(value: Any) -> bool:
+        """Return True if a config value is present and not just whitespace."""
+        return bool(value) and bool(str(value).strip())
 
-        try:
-            with open(self._metadata_path, encoding="utf-8") as f:
-                data: dict[str, Any] = json.load(f)
-                return data
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.warning(f"Could not load tutor metadata: {e}, using defaults")
-            return {
-                "french_tutor": {
-                    "display_name": "French Tutor",
-                    "flag_emoji": "🇫🇷",
-                    "accent_color": "#FF6B9D",
-                },
-                "spanish_tutor": {
-                    "display_name": "Spanish Tutor",
-                    "flag_emoji": "🇪🇸",
-                    "accent_color": "#FFB347",
-                },
-                "german_tutor": {
-                    "display_name": "German Tutor",
-                    "flag_emoji": "🇩🇪",
-                    "accent_color": "#7B68EE",
-                },
-                "italian_tutor": {
-                    "display_name": "Italian Tutor",
-                    "flag_emoji": "🇮🇹",
-                    "accent_color": "#50C878",
-                },
-                "portuguese_tutor": {
-                    "display_name": "Portuguese Tutor",
-                    "flag_emoji": "🇧🇷",
-                    "accent_color": "#FDB913",
-                },
-                "default": {
-                    "display_name": "Language Partner",
-                    "flag_emoji": "🌍",
-                    "accent_color": "#4ECDC4",
-                },
-            }
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client used for key validation, created on first use and then reused."""
+        if self._s.http_client is None:
+            # httpx is only needed once a key is validated
+            import httpx
+
+            self._s.http_client = httpx.AsyncClient(timeout=10.0)
+        return self._s.http_client
 
     def _get_profile_choices(self) -> list[str]:
-        """Get list of available profile choices."""
-        return [DEFAULT_OPTION, *list_personalities()]
+        """Get list of available profile choices (scanned once, then cached)."""
+        if self._s.profile_choices is None:
+            self._s.profile_choices = [DEFAULT_OPTION, *list_personalities()]
+        return self._s.profile_choices
+
+    def refresh_profile_choices(self) -> None:
+        """Drop the cached profile list so the next lookup rescans the profiles directory."""
+        self._s.profile_choices = None
 
     def _get_current_profile(self) -> str:
         """Get currently active profile."""
-        profile = getattr(config, "REACHY_MINI_CUSTOM_PROFILE", None)
-        return profile if profile else DEFAULT_OPTION
+        return config.REACHY_MINI_CUSTOM_PROFILE or DEFAULT_OPTION
 
     def _get_profile_display_name(self, profile_id: str) -> str:
         """Get display name for a profile."""
@@ -146,85 +185,49 @@ class GradioAdminUI:
             meta = self.tutor_metadata.get(profile_id, {})
         if not meta:
             meta = {"display_name": profile_id, "flag_emoji": "", "accent_color": "#4ECDC4"}
-        return f"""
-        <h1 style="
-            font-family: 'Outfit', system-ui, sans-serif;
-            font-size: clamp(1.5rem, 4vw, 2.5rem);
-            font-weight: 700;
-            letter-spacing: -0.02em;
-            background: linear-gradient(135deg, {meta.get("accent_color", "#4ECDC4")} 0%, {meta.get("accent_color", "#4ECDC4")}99 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin: 0;
-            padding: 8px 0;
-            text-align: center;
-        ">
-            {meta.get("flag_emoji", "🌍")} {meta.get("display_name", "Language Partner")}
-        </h1>
+        return _render_title_html(
+            meta.get("accent_color", "#4ECDC4"),
+            meta.get("flag_emoji", "🌍"),
+            meta.get("display_name", "Language Partner"),
+        )
+
+    def _persist_in_background(self, updates: dict[str, str]) -> None:
+        """Queue a .env write so handlers can return before the file is written.
+
+        Writes run one at a time, in submission order, on a single worker
+        thread. The executor's non-daemon worker is joined at interpreter exit,
+        so queued writes are not lost on shutdown.
         """
+        if not self._instance_path or not updates:
+            return
+        if self._s.persist_executor is None:
+            self._s.persist_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="admin-env-persist")
+        self._s.persist_executor.submit(self._persist_env_values, updates)
 
-    def _read_env_lines(self, env_path: Path) -> list[str]:
-        """Load env file contents or a template as a list of lines."""
-        inst = env_path.parent
-        try:
-            if env_path.exists():
-                try:
-                    return env_path.read_text(encoding="utf-8").splitlines()
-                except Exception:
-                    return []
-            template_text = None
-            ex = inst / ".env.example"
-            if ex.exists():
-                try:
-                    template_text = ex.read_text(encoding="utf-8")
-                except Exception:
-                    template_text = None
-            if template_text is None:
-                try:
-                    cwd_example = Path.cwd() / ".env.example"
-                    if cwd_example.exists():
-                        template_text = cwd_example.read_text(encoding="utf-8")
-                except Exception:
-                    template_text = None
-            if template_text is None:
-                packaged = Path(__file__).parent / ".env.example"
-                if packaged.exists():
-                    try:
-                        template_text = packaged.read_text(encoding="utf-8")
-                    except Exception:
-                        template_text = None
-            return template_text.splitlines() if template_text else []
-        except Exception:
-            return []
-
-    def _persist_env_value(self, key: str, value: str) -> None:
-        """Persist a single key=value to the instance .env file."""
-        if not self._instance_path:
+    def _persist_env_values(self, updates: dict[str, str]) -> None:
+        """Persist several key=value pairs to the instance .env file in one write.
+
+        Later calls edit an in-memory copy of the file and write it back; the file
+        is only re-read when its mtime or size shows it was changed elsewhere.
+        """
+        if not self._instance_path or not updates:
             return
+        keys = ", ".join(updates)
         try:
             env_path = Path(self._instance_path) / ".env"
-            lines = self._read_env_lines(env_path)
-            replaced = False
-            for i, ln in enumerate(lines):
-                if ln.strip().startswith(f"{key}="):
-                    lines[i] = f"{key}={value}"
-                    replaced = True
-                    break
-            if not replaced:
-                lines.append(f"{key}={value}")
-            final_text = "\n".join(lines) + "\n"
-            env_path.write_text(final_text, encoding="utf-8")
-            logger.info("Persisted %s to %s", key, env_path)
-
-            try:
-                from dotenv import load_dotenv
-
-                load_dotenv(dotenv_path=str(env_path), override=True)
-            except Exception:
-                pass
+            with self._env_lock:
+                self._write_env_updates(env_path, updates)
         except Exception as e:
-            logger.warning("Failed to persist %s: %s", key, e)
+            logger.warning("Failed to persist %s: %s", keys, e)
+
+    def _write_env_updates(self, env_path: Path, updates: dict[str, str]) -> None:
+        """Apply updates to the .env mirror and write it out if anything changed."""
+        signature = env_file_signature(env_path)
+        if self._s.env_lines is None or signature != self._s.env_signature:
+            self._s.env_lines = read_env_lines(env_path, find_env_template(self._instance_path))
+        if persist_env_updates(env_path, self._s.env_lines, updates):
+            signature = env_file_signature(env_path)
+        self._s.env_signature = signature
 
     def create_components(self) -> None:
         """Create all admin UI components.
@@ -233,8 +236,8 @@ class GradioAdminUI:
         This matches the pattern used in the reference gradio_personality.py.
         """
         # Check current state
-        has_openai_key = bool(config.OPENAI_API_KEY and str(config.OPENAI_API_KEY).strip())
-        has_supermemory_key = bool(config.SUPERMEMORY_API_KEY and str(config.SUPERMEMORY_API_KEY).strip())
+        has_openai_key = self._s.openai_configured
+        has_supermemory_key = self._s.supermemory_configured
         current_profile = self._get_current_profile()
 
         # Dynamic title
@@ -253,9 +256,10 @@ class GradioAdminUI:
 **Step 3:** Click the microphone and start speaking!""")
 
         # Language Profile Selector
+        # Only the current choice at build time; the full list is filled in on page load
         self.profile_dropdown = gr.Dropdown(
             label="Select Language Tutor",
-            choices=self._get_profile_choices(),
+            choices=list(dict.fromkeys((DEFAULT_OPTION, current_profile))),
             value=current_profile,
         )
         self.profile_apply_btn = gr.Button("Apply Tutor", variant="primary")
@@ -349,72 +353,87 @@ class GradioAdminUI:
 
         """
         with blocks:
-            # Track key configuration state
-            self._openai_configured = bool(config.OPENAI_API_KEY and str(config.OPENAI_API_KEY).strip())
-            self._supermemory_configured = bool(config.SUPERMEMORY_API_KEY and str(config.SUPERMEMORY_API_KEY).strip())
-
             # --- OpenAI API Key Events ---
             async def handle_openai_btn_click(
                 current_value: str,
-            ) -> tuple[gr.Textbox, gr.Markdown, gr.Button]:
+            ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
                 """Handle OpenAI button click - either validate/save or enable editing."""
                 # If currently configured, switch to edit mode
-                if self._openai_configured:
-                    self._openai_configured = False
+                if self._s.openai_configured:
+                    self._s.openai_configured = False
                     return (
-                        gr.Textbox(value="", placeholder="sk-...", interactive=True),
-                        gr.Markdown("**Status:** Enter new key"),
-                        gr.Button("Save & Validate", variant="primary"),
+                        gr.update(value="", placeholder="sk-...", interactive=True),
+                        gr.update(value="**Status:** Enter new key"),
+                        gr.update(value="Save & Validate", variant="primary"),
                     )
 
                 # Otherwise, validate and save the key
                 key = (current_value or "").strip()
                 if not key:
                     return (
-                        gr.Textbox(interactive=True),
-                        gr.Markdown("**Status:** Please enter a key"),
-                        gr.Button("Save & Validate", variant="primary"),
+                        gr.update(interactive=True),
+                        gr.update(value="**Status:** Please enter a key"),
+                        gr.update(value="Save & Validate", variant="primary"),
                     )
 
-                # Validate key
+                # Validate key by retrieving the configured model (single-object payload, not the full listing).
+                # 401 means a bad key; 403/404 mean the key works but cannot see that model (custom or
+                # project-scoped). Anything else leaves the key unverified, so it is not saved.
                 try:
-                    async with httpx.AsyncClient(timeout=10.0) as client:
-                        headers = {"Authorization": f"Bearer {key}"}
-                        response = await client.get("https://api.openai.com/v1/models", headers=headers)
-                        if response.status_code != 200:
-                            return (
-                                gr.Textbox(interactive=True),
-                                gr.Markdown("**Status:** Invalid key ✗"),
-                                gr.Button("Save & Validate", variant="primary"),
-                            )
+                    headers = {"Authorization": f"Bearer {key}"}
+                    response = await self._get_http_client().get(
+                        f"https://api.openai.com/v1/models/{quote(config.MODEL_NAME, safe='')}", headers=headers
+                    )
+                    if response.status_code == 401:
+                        return (
+                            gr.update(interactive=True),
+                            gr.update(value="**Status:** Invalid key ✗"),
+                            gr.update(value="Save & Validate", variant="primary"),
+                        )
+                    if response.status_code not in (200, 403, 404):
+                        return (
+                            gr.update(interactive=True),
+                            gr.update(value=f"**Status:** Validation failed - HTTP {response.status_code}"),
+                            gr.update(value="Save & Validate", variant="primary"),
+                        )
+                    model_accessible = response.status_code == 200
                 except Exception as e:
                     logger.warning(f"API key validation failed: {e}")
                     return (
-                        gr.Textbox(interactive=True),
-                        gr.Markdown(f"**Status:** Validation failed - {e}"),
-                        gr.Button("Save & Validate", variant="primary"),
+                        gr.update(interactive=True),
+                        gr.update(value=f"**Status:** Validation failed - {e}"),
+                        gr.update(value="Save & Validate", variant="primary"),
                     )
 
                 # Save key
                 try:
-                    os.environ["OPENAI_API_KEY"] = key
-                    config.OPENAI_API_KEY = key
-                    self._persist_env_value("OPENAI_API_KEY", key)
-                    if self._on_api_key_change:
+                    # Re-saving the active key only re-checks the .env; config and listeners are left alone
+                    changed = key != config.OPENAI_API_KEY
+                    if changed:
+                        apply_config_updates({"OPENAI_API_KEY": key})
+                    self._persist_in_background({"OPENAI_API_KEY": key})
+                    if changed and self._on_api_key_change:
                         self._on_api_key_change(key)
-                    self._openai_configured = True
+                    self._s.openai_configured = True
                 except Exception as e:
                     logger.warning(f"Failed to save API key: {e}")
                     return (
-                        gr.Textbox(interactive=True),
-                        gr.Markdown(f"**Status:** Save failed - {e}"),
-                        gr.Button("Save & Validate", variant="primary"),
+                        gr.update(interactive=True),
+                        gr.update(value=f"**Status:** Save failed - {e}"),
+                        gr.update(value="Save & Validate", variant="primary"),
                     )
 
+                if model_accessible:
+                    status = "**Status:** Configured ✓"
+                else:
+                    status = (
+                        f"**Status:** Configured ✓ (model `{config.MODEL_NAME}` not accessible with this key, "
+                        f"HTTP {response.status_code})"
+                    )
                 return (
-                    gr.Textbox(value="••••••••••••••••", interactive=False),
-                    gr.Markdown("**Status:** Configured ✓"),
-                    gr.Button("Change Key", variant="secondary"),
+                    gr.update(value="••••••••••••••••", interactive=False),
+                    gr.update(value=status),
+                    gr.update(value="Change Key", variant="secondary"),
                 )
 
             self.openai_save_btn.click(
@@ -426,45 +445,46 @@ class GradioAdminUI:
             # --- SuperMemory API Key Events ---
             def handle_supermemory_btn_click(
                 current_value: str,
-            ) -> tuple[gr.Textbox, gr.Markdown, gr.Button]:
+            ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
                 """Handle SuperMemory button click - either save or enable editing."""
                 # If currently configured, switch to edit mode
-                if self._supermemory_configured:
-                    self._supermemory_configured = False
+                if self._s.supermemory_configured:
+                    self._s.supermemory_configured = False
                     return (
-                        gr.Textbox(value="", placeholder="Enter SuperMemory key...", interactive=True),
-                        gr.Markdown("**Status:** Enter new key"),
-                        gr.Button("Save", variant="primary"),
+                        gr.update(value="", placeholder="Enter SuperMemory key...", interactive=True),
+                        gr.update(value="**Status:** Enter new key"),
+                        gr.update(value="Save", variant="primary"),
                     )
 
                 # Otherwise, save the key
                 key = (current_value or "").strip()
                 try:
-                    os.environ["SUPERMEMORY_API_KEY"] = key
-                    config.SUPERMEMORY_API_KEY = key
+                    changed = key != (config.SUPERMEMORY_API_KEY or "")
+                    if changed:
+                        apply_config_updates({"SUPERMEMORY_API_KEY": key})
                     if key:
-                        self._persist_env_value("SUPERMEMORY_API_KEY", key)
-                        self._supermemory_configured = True
-                    if self._on_supermemory_key_change:
+                        self._persist_in_background({"SUPERMEMORY_API_KEY": key})
+                        self._s.supermemory_configured = True
+                    if changed and self._on_supermemory_key_change:
                         self._on_supermemory_key_change(key)
                 except Exception as e:
                     logger.warning(f"Failed to save SuperMemory key: {e}")
                     return (
-                        gr.Textbox(interactive=True),
-                        gr.Markdown(f"**Status:** Failed - {e}"),
-                        gr.Button("Save", variant="primary"),
+                        gr.update(interactive=True),
+                        gr.update(value=f"**Status:** Failed - {e}"),
+                        gr.update(value="Save", variant="primary"),
                     )
 
                 if key:
                     return (
-                        gr.Textbox(value="••••••••••••••••", interactive=False),
-                        gr.Markdown("**Status:** Configured ✓"),
-                        gr.Button("Change Key", variant="secondary"),
+                        gr.update(value="••••••••••••••••", interactive=False),
+                        gr.update(value="**Status:** Configured ✓"),
+                        gr.update(value="Change Key", variant="secondary"),
                     )
                 return (
-                    gr.Textbox(interactive=True),
-                    gr.Markdown("**Status:** Cleared"),
-                    gr.Button("Save", variant="primary"),
+                    gr.update(interactive=True),
+                    gr.update(value="**Status:** Cleared"),
+                    gr.update(value="Save", variant="primary"),
                 )
 
             self.supermemory_save_btn.click(
@@ -483,6 +503,7 @@ class GradioAdminUI:
 
                     if self._on_profile_change:
                         self._on_profile_change(sel)
+                    self.refresh_profile_choices()
 
                     new_title = self._render_title(profile_name)
                     return new_title, f"Applied: {status}"
@@ -496,6 +517,12 @@ class GradioAdminUI:
                 outputs=[self.title_display, self.profile_status],
             )
 
+            def load_profile_choices() -> dict[str, Any]:
+                """Populate the tutor dropdown when the page opens (profiles are scanned on first use)."""
+                return gr.update(choices=self._get_profile_choices(), value=self._get_current_profile())
+
+            blocks.load(fn=load_profile_choices, outputs=[self.profile_dropdown])
+
             # --- Idle Settings Events ---
             def save_idle_settings(enable: bool, timeout: int) -> str:
                 """Save idle behavior settings."""
@@ -504,19 +531,17 @@ class GradioAdminUI:
                     if not (30 <= timeout <= 900):
                         return "Error: Timeout must be between 30 and 900 seconds"
 
-                    # Update config
-                    config.ENABLE_IDLE_SIGNALS = enable
-                    config.IDLE_SIGNAL_TIMEOUT = timeout
-
-                    # Update env
-                    os.environ["ENABLE_IDLE_SIGNALS"] = str(enable).lower()
-                    os.environ["IDLE_SIGNAL_TIMEOUT"] = str(timeout)
+                    # Unchanged settings leave config and listeners alone, but are still persisted so the
+                    # defaults can be pinned in the instance .env (the write is skipped if the file matches)
+                    changed = enable != config.ENABLE_IDLE_SIGNALS or timeout != config.IDLE_SIGNAL_TIMEOUT
+                    if changed:
+                        apply_config_updates({"ENABLE_IDLE_SIGNALS": enable, "IDLE_SIGNAL_TIMEOUT": timeout})
 
-                    # Persist
-                    self._persist_env_value("ENABLE_IDLE_SIGNALS", str(enable).lower())
-                    self._persist_env_value("IDLE_SIGNAL_TIMEOUT", str(timeout))
+                    self._persist_in_background(
+                        {"ENABLE_IDLE_SIGNALS": str(enable).lower(), "IDLE_SIGNAL_TIMEOUT": str(timeout)}
+                    )
 
-                    if self._on_idle_settings_change:
+                    if changed and self._on_idle_settings_change:
                         self._on_idle_settings_change(enable, timeout)
 
                     return f"Saved: Idle {'enabled' if enable else 'disabled'}, timeout {timeout}s"
@@ -6,16 +6,129 @@ tutor cards instead of the developer-oriented personality management interface.
 
 from __future__ import annotations
 import os
-import json
 import logging
-from typing import Any
-from pathlib import Path
+from typing import Any, Final
+from dataclasses import dataclass
 
 import gradio as gr
 
+from reachy_mini_language_tutor.config import config
+from reachy_mini_language_tutor.tutor_metadata import METADATA_PATH, load_metadata
+
 
 logger = logging.getLogger(__name__)
 
+# Static markup for the selector title; only the accent colour, flag and name vary per tutor
+_TITLE_TEMPLATE: Final[str] = """
+        <h1 style="
+            font-family: 'Outfit', system-ui, sans-serif;
+            font-size: clamp(2rem, 5vw, 3rem);
+            font-weight: 700;
+            letter-spacing: -0.02em;
+            background: linear-gradient(135deg, {accent} 0%, {accent_mid} 50%, {accent_end} 100%);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            background-clip: text;
+            margin: 0;
+            padding: 16px 0;
+            text-align: center;
+        ">
+            {flag} {name}
+        </h1>
+        """
+
+
+@dataclass(slots=True, frozen=True)
+class TutorProfile:
+    """Display metadata for one tutor card."""
+
+    id: str
+    display_name: str
+    language: str
+    flag_emoji: str
+    short_description: str
+    level: str
+    accent_color: str
+
+    @classmethod
+    def from_metadata(cls, profile_id: str, data: dict[str, Any]) -> TutorProfile:
+        """Build a profile from its ``profile_metadata.json`` entry, ignoring unknown keys."""
+        return cls(
+            id=profile_id,
+            display_name=data["display_name"],
+            language=data["language"],
+            flag_emoji=data["flag_emoji"],
+            short_description=data["short_description"],
+            level=data["level"],
+            accent_color=data["accent_color"],
+        )
+
+
+# Static markup for a tutor card; {styles} and {checkmark} depend on the selection state
+_CARD_TEMPLATE: Final[str] = """
+    <div class="tutor-card" style="{styles} position: relative;">
+        {checkmark}
+        <div class="tutor-header">
+            <span class="tutor-flag">{flag}</span>
+            <h3 class="tutor-name">{name}</h3>
+        </div>
+        <p class="tutor-language">{language}</p>
+        <p class="tutor-description">{description}</p>
+        <span class="tutor-level">{level}</span>
+    </div>
+    """
+
+_SELECTED_STYLES_TEMPLATE: Final[str] = """
+            background: linear-gradient(135deg, {accent}10 0%, {accent}20 100%);
+            border-left: 6px solid {accent};
+            box-shadow: 0 4px 16px {accent}40;
+            transform: scale(1.02);
+        """
+
+_UNSELECTED_STYLES_TEMPLATE: Final[str] = "border-left: 4px solid {accent};"
+
+_CHECKMARK_TEMPLATE: Final[str] = """
+            <div style="
+                position: absolute;
+                top: 12px;
+                right: 12px;
+                background: {accent};
+                color: white;
+                width: 28px;
+                height: 28px;
+                border-radius: 50%;
+                display: flex;
+                align-items: center;
+                justify-content: center;
+                font-size: 1rem;
+                font-weight: bold;
+                box-shadow: 0 2px 8px rgba(0,0,0,0.2);
+            ">✓</div>
+        """
+
+
+def _render_card_html(
+    accent: str, flag: str, name: str, language: str, description: str, level: str, is_selected: bool
+) -> str:
+    """Build tutor card HTML (TutorSelectorUI renders each card variant once, up front)."""
+    if is_selected:
+        styles = _SELECTED_STYLES_TEMPLATE.format(accent=accent)
+        checkmark = _CHECKMARK_TEMPLATE.format(accent=accent)
+    else:
+        styles = _UNSELECTED_STYLES_TEMPLATE.format(accent=accent)
+        checkmark = ""
+    return _CARD_TEMPLATE.format_map(
+        {
+            "styles": styles,
+            "checkmark": checkmark,
+            "flag": flag,
+            "name": name,
+            "language": language,
+            "description": description,
+            "level": level,
+        }
+    )
+
 
 class TutorSelectorUI:
     """Container for language tutor selection UI components."""
@@ -23,7 +136,7 @@ class TutorSelectorUI:
     def __init__(self) -> None:
         """Initialize the TutorSelectorUI instance."""
         # Paths
-        self._metadata_path = Path(__file__).parent / "profile_metadata.json"
+        self._metadata_path = METADATA_PATH
 
         # Components (initialized in create_components)
         self.title_display: gr.HTML
@@ -34,134 +147,73 @@ class TutorSelectorUI:
 
         # Tutor metadata
         self.tutor_metadata = self._load_metadata()
-        self.tutor_profiles = [{**data, "id": profile_id} for profile_id, data in self.tutor_metadata.items()]
+        self.tutor_profiles = [TutorProfile.from_metadata(pid, data) for pid, data in self.tutor_metadata.items()]
+        self._id_to_index = {pid: i for i, pid in enumerate(self.tutor_metadata)}
 
-        # Track current selection (find default profile index)
-        self.selected_index = next((i for i, p in enumerate(self.tutor_profiles) if p["id"] == "default"), 0)
+        # Track current selection (start on the active profile)
+        self.selected_index = self._id_to_index.get(config.REACHY_MINI_CUSTOM_PROFILE or "default", 0)
+
+        # Card HTML per profile as (unselected, selected), plus each profile's title; the markup never
+        # changes at runtime, so selection only has to pick strings
+        self._card_html = [
+            (self._render_tutor_card(p), self._render_tutor_card(p, is_selected=True)) for p in self.tutor_profiles
+        ]
+        self._title_html = [self._render_title(p) for p in self.tutor_profiles]
+        # Samples last sent to the cards Dataset; a selection change only swaps two rows
+        self._samples = self._render_all_cards()
 
     def _load_metadata(self) -> dict[str, Any]:
         """Load tutor metadata from JSON file.
 
         Returns:
-            Dictionary of tutor profiles with display metadata.
-            Falls back to empty dict if file not found.
+            Dictionary of tutor profiles with display metadata, parsed again only
+            when the file changes and shared with the admin UI.
+            Falls back to the bundled defaults if the file is missing or invalid.
 
         """
-        try:
-            with open(self._metadata_path, encoding="utf-8") as f:
-                data: dict[str, Any] = json.load(f)
-                return data
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.warning(f"Could not load tutor metadata: {e}, using defaults")
-            # Fallback: minimal defaults
-            return {
-                "french_tutor": {
-                    "display_name": "French Tutor",
-                    "language": "French",
-                    "flag_emoji": "🇫🇷",
-                    "short_description": "Practice French",
-                    "level": "All levels",
-                    "accent_color": "#FF6B9D",
-                },
-                "spanish_tutor": {
-                    "display_name": "Spanish Tutor",
-                    "language": "Spanish",
-                    "flag_emoji": "🇪🇸",
-                    "short_description": "Practice Spanish",
-                    "level": "All levels",
-                    "accent_color": "#FFB347",
-                },
-                "default": {
-                    "display_name": "Language Partner",
-                    "language": "Any",
-                    "flag_emoji": "🌍",
-                    "short_description": "Practice any language",
-                    "level": "All levels",
-                    "accent_color": "#4ECDC4",
-                },
-            }
+        return load_metadata(str(self._metadata_path))
 
-    def _render_tutor_card(self, profile: dict[str, Any], is_selected: bool = False) -> str:
+    def _render_tutor_card(self, profile: TutorProfile, is_selected: bool = False) -> str:
         """Generate HTML for a tutor card.
 
         Args:
-            profile: Dictionary with tutor metadata (display_name, language, etc.)
+            profile: Tutor display metadata (display_name, language, etc.)
             is_selected: Whether this card is currently selected.
 
         Returns:
             HTML string for the tutor card.
 
         """
-        selected_styles = ""
-        checkmark = ""
-        if is_selected:
-            selected_styles = f"""
-                background: linear-gradient(135deg, {profile["accent_color"]}10 0%, {profile["accent_color"]}20 100%);
-                border-left: 6px solid {profile["accent_color"]};
-                box-shadow: 0 4px 16px {profile["accent_color"]}40;
-                transform: scale(1.02);
-            """
-            checkmark = f"""
-                <div style="
-                    position: absolute;
-                    top: 12px;
-                    right: 12px;
-                    background: {profile["accent_color"]};
-                    color: white;
-                    width: 28px;
-                    height: 28px;
-                    border-radius: 50%;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    font-size: 1rem;
-                    font-weight: bold;
-                    box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-                ">✓</div>
-            """
-        else:
-            selected_styles = f"border-left: 4px solid {profile['accent_color']};"
-
-        return f"""
-        <div class="tutor-card" style="{selected_styles} position: relative;">
-            {checkmark}
-            <div class="tutor-header">
-                <span class="tutor-flag">{profile["flag_emoji"]}</span>
-                <h3 class="tutor-name">{profile["display_name"]}</h3>
-            </div>
-            <p class="tutor-language">{profile["language"]}</p>
-            <p class="tutor-description">{profile["short_description"]}</p>
-            <span class="tutor-level">{profile["level"]}</span>
-        </div>
-        """
+        return _render_card_html(
+            profile.accent_color,
+            profile.flag_emoji,
+            profile.display_name,
+            profile.language,
+            profile.short_description,
+            profile.level,
+            is_selected,
+        )
 
-    def _render_title(self, profile: dict[str, Any]) -> str:
+    def _render_title(self, profile: TutorProfile) -> str:
         """Generate HTML for the dynamic title showing current tutor.
 
         Args:
-            profile: Dictionary with current tutor metadata.
+            profile: Current tutor display metadata.
 
         Returns:
             HTML string for the title.
 
         """
-        return f"""
-        <h1 style="
-            font-family: 'Outfit', system-ui, sans-serif;
-            font-size: clamp(2rem, 5vw, 3rem);
-            font-weight: 700;
-            letter-spacing: -0.02em;
-            background: linear-gradient(135deg, {profile["accent_color"]} 0%, {profile["accent_color"]}99 50%, {profile["accent_color"]}66 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin: 0;
-            padding: 16px 0;
-            text-align: center;
-        ">
-            {profile["flag_emoji"]} {profile["display_name"]}
-        </h1>
-        """
+        accent = profile.accent_color
+        return _TITLE_TEMPLATE.format_map(
+            {
+                "accent": accent,
+                "accent_mid": f"{accent}99",
+                "accent_end": f"{accent}66",
+                "flag": profile.flag_emoji,
+                "name": profile.display_name,
+            }
+        )
 
     def _render_all_cards(self) -> list[list[str]]:
         """Render all tutor cards with current selection state.
@@ -170,19 +222,23 @@ class TutorSelectorUI:
             List of card HTML samples for gr.Dataset.
 
         """
-        return [
-            [self._render_tutor_card(profile, is_selected=(i == self.selected_index))]
-            for i, profile in enumerate(self.tutor_profiles)
-        ]
+        selected = self.selected_index
+        return [[html[i == selected]] for i, html in enumerate(self._card_html)]
+
+    def _select(self, index: int) -> None:
+        """Move the selection to ``index``, updating only the two card rows that change."""
+        previous = self.selected_index
+        samples = self._samples.copy()
+        samples[previous] = [self._card_html[previous][0]]
+        samples[index] = [self._card_html[index][1]]
+        self.selected_index = index
+        self._samples = samples
 
     def create_components(self) -> None:
         """Instantiate Gradio components for the tutor selector UI."""
-        # Get current profile
-        current_profile = self.tutor_profiles[self.selected_index]
-
         # Dynamic title showing current tutor
         self.title_display = gr.HTML(
-            value=self._render_title(current_profile),
+            value=self._title_html[self.selected_index],
             label="",
         )
 
@@ -211,7 +267,7 @@ Click the microphone button and start speaking! Your tutor will respond with voi
         # Tutor selection cards with selection highlighting
         self.tutor_cards = gr.Dataset(
             components=[gr.HTML()],
-            samples=self._render_all_cards(),
+            samples=self._samples,
             label="Choose Your Language Partner",
             samples_per_page=3,
             type="index",
@@ -259,40 +315,45 @@ Click the microphone button and start speaking! Your tutor will respond with voi
         """
 
         # Tutor card selection handler
-        async def _on_tutor_selected(evt: gr.SelectData) -> tuple[str, gr.Dataset, str]:
+        async def _on_tutor_selected(evt: gr.SelectData) -> tuple[str, dict[str, Any], str | dict[str, Any]]:
             """Handle tutor card selection and apply personality.
 
             Args:
                 evt: SelectData containing the selected card index.
 
             Returns:
-                Tuple of (title_html, updated_cards, status_message).
+                Tuple of (title_html, cards_update, status_message). When the
+                clicked tutor is already active, only the cards are re-synced.
 
             """
+            # Clicking the active tutor would only re-apply the same personality. The check uses the
+            # config rather than selected_index, which is shared by every browser session.
+            if self.tutor_profiles[evt.index].id == (config.REACHY_MINI_CUSTOM_PROFILE or "default"):
+                if evt.index != self.selected_index:
+                    self._select(evt.index)
+                return self._title_html[self.selected_index], gr.update(samples=self._samples), gr.skip()
             try:
-                # Update selected index
-                self.selected_index = evt.index
-                selected_profile = self.tutor_profiles[self.selected_index]
-                profile_id = selected_profile["id"]
+                selected_profile = self.tutor_profiles[evt.index]
+                profile_id = selected_profile.id
 
                 # Convert profile ID to handler format (None for default)
                 profile_name = None if profile_id == "default" else profile_id
 
-                # Apply personality
+                # Apply personality, then commit the selection so a failed switch can be retried
                 status_msg = await handler.apply_personality(profile_name)
+                self._select(evt.index)
 
-                # Re-render title and cards with new selection
-                new_title = self._render_title(selected_profile)
-                updated_cards = gr.Dataset(samples=self._render_all_cards())
+                # Swap in the prerendered title and cards for the new selection
+                new_title = self._title_html[self.selected_index]
+                updated_cards = gr.update(samples=self._samples)
 
                 return new_title, updated_cards, f"✅ {status_msg}"
             except Exception as e:
                 logger.error(f"Error applying tutor profile: {e}", exc_info=True)
                 # Keep current state on error
-                current_profile = self.tutor_profiles[self.selected_index]
                 return (
-                    self._render_title(current_profile),
-                    gr.Dataset(samples=self._render_all_cards()),
+                    self._title_html[self.selected_index],
+                    gr.update(samples=self._samples),
                     f"❌ Error switching tutor: {e}",
                 )
 
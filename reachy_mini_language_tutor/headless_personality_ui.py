@@ -59,7 +59,7 @@ def mount_personality_routes(
                 stored = get_persisted_personality()
                 if stored:
                     return stored
-            env_val = getattr(config, "REACHY_MINI_CUSTOM_PROFILE", None)
+            env_val = config.REACHY_MINI_CUSTOM_PROFILE
             if env_val:
                 return env_val
         except Exception:
@@ -68,8 +68,7 @@ def mount_personality_routes(
 
     def _current_choice() -> str:
         try:
-            cur = getattr(config, "REACHY_MINI_CUSTOM_PROFILE", None)
-            return cur or DEFAULT_OPTION
+            return config.REACHY_MINI_CUSTOM_PROFILE or DEFAULT_OPTION
         except Exception:
             return DEFAULT_OPTION
 
@@ -5,7 +5,7 @@ import time
 import asyncio
 import argparse
 import threading
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Tuple, Optional
 
 import gradio as gr
 from fastapi import FastAPI
@@ -20,6 +20,14 @@ from reachy_mini_language_tutor.utils import (
 from reachy_mini_language_tutor.config import set_custom_profile
 
 
+# (wireless_version, on_device) -> (media backend, extra ReachyMini kwargs, log message)
+_ROBOT_BACKENDS: Dict[Tuple[bool, bool], Tuple[str, Dict[str, Any], str]] = {
+    (True, False): ("webrtc", {"localhost_only": False}, "Using WebRTC backend for fully remote wireless version"),
+    (True, True): ("gstreamer", {}, "Using GStreamer backend for on-device wireless version"),
+}
+_DEFAULT_ROBOT_BACKEND: Tuple[str, Dict[str, Any], str] = ("default", {}, "Using default backend for lite version")
+
+
 def update_chatbot(chatbot: List[Dict[str, Any]], response: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Update the chatbot with AdditionalOutputs."""
     chatbot.append(response)
@@ -68,15 +76,11 @@ def run(
         #   2. Reachy Mini daemon running on localhost (same device)
         #   3. Reachy Mini daemon on local network (same subnet)
 
-        if args.wireless_version and not args.on_device:
-            logger.info("Using WebRTC backend for fully remote wireless version")
-            robot = ReachyMini(media_backend="webrtc", localhost_only=False)
-        elif args.wireless_version and args.on_device:
-            logger.info("Using GStreamer backend for on-device wireless version")
-            robot = ReachyMini(media_backend="gstreamer")
-        else:
-            logger.info("Using default backend for lite version")
-            robot = ReachyMini(media_backend="default")
+        backend, robot_kwargs, message = _ROBOT_BACKENDS.get(
+            (bool(args.wireless_version), bool(args.on_device)), _DEFAULT_ROBOT_BACKEND
+        )
+        logger.info(message)
+        robot = ReachyMini(media_backend=backend, **robot_kwargs)
 
     # Check if running in simulation mode without --gradio
     if robot.client.get_status()["simulation_enabled"] and not args.gradio:
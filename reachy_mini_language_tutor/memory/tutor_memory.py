@@ -1,14 +1,43 @@
 """Memory manager for language tutors using SuperMemory.AI."""
 
 from __future__ import annotations
+import time
+import asyncio
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from collections import OrderedDict
 
-from supermemory import AsyncSupermemory
+
+if TYPE_CHECKING:
+    from supermemory import AsyncSupermemory
 
 
 logger = logging.getLogger(__name__)
 
+# Query used to build the session-start context
+_CONTEXT_QUERY = "Learner name, personal information, learning progress, preferences, and recent sessions"
+# Repeated searches (session restarts, personality switches, recall retries) within this window reuse the results
+_SEARCH_TTL_S = 60.0
+# Most (query, limit) results kept in the search cache
+_SEARCH_CACHE_SIZE = 32
+# Categories used by store() callers; their content prefixes are built once per instance
+_CATEGORIES = ("conversation", "progress", "preference", "struggle", "success", "personal")
+# Most memories the background writer sends concurrently
+_STORE_BATCH = 10
+
+
+def _result_text(result: Any) -> str:
+    """Return the text of a search result.
+
+    ``content`` is only filled when full documents are requested, so fall back
+    to the summary, then to the matching chunks.
+    """
+    if result.content:
+        return str(result.content)
+    if result.summary:
+        return str(result.summary)
+    return " ".join(chunk.content for chunk in result.chunks)
+
 
 class TutorMemory:
     """Manages persistent memory for language tutors using SuperMemory.AI.
@@ -25,13 +54,77 @@ class TutorMemory:
             profile_name: Profile name for user ID (default: "default").
 
         """
-        self.client = AsyncSupermemory(api_key=api_key)
+        self._api_key = api_key
+        self._client: AsyncSupermemory | None = None
         self.user_id = f"{profile_name}_learner"
+        self._prefixes = {c: f"[{c}] [user:{self.user_id}] " for c in _CATEGORIES}
+        # (query, limit) -> (fetched_at, results), least recently used first; cleared when memories are stored
+        self._search_cache: OrderedDict[tuple[str, int], tuple[float, list[Any]]] = OrderedDict()
+        # Searches currently in flight, shared by every caller asking for the same (query, limit)
+        self._inflight: dict[tuple[str, int], asyncio.Task[list[Any]]] = {}
+        # Bumped whenever the cache is cleared, so searches started before a store are not cached
+        self._cache_gen = 0
+        # Write-behind queue for store(), drained by a task started on first use
+        self._pending: asyncio.Queue[str] | None = None
+        self._writer: asyncio.Task[None] | None = None
         logger.info(f"TutorMemory initialized for profile: {profile_name}")
 
+    @property
+    def client(self) -> AsyncSupermemory:
+        """SuperMemory client, created (and the SDK imported) on first use."""
+        if self._client is None:
+            from supermemory import AsyncSupermemory
+
+            self._client = AsyncSupermemory(api_key=self._api_key)
+        return self._client
+
+    async def _search_results(self, query: str, limit: int) -> list[Any]:
+        """Return up to ``limit`` raw search results, served from the cache while fresh.
+
+        Concurrent misses for the same key share a single request. Raises
+        whatever the SuperMemory client raises; failures are not cached.
+        """
+        key = (query, limit)
+        cache = self._search_cache
+        cached = cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _SEARCH_TTL_S:
+            cache.move_to_end(key)
+            return cached[1]
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._fetch_results(key))
+            self._inflight[key] = task
+            task.add_done_callback(self._forget_inflight)
+        # Shield so one caller giving up does not cancel the request for the others
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, task: asyncio.Task[list[Any]]) -> None:
+        """Drop a finished search from the in-flight map (unless a newer one replaced it)."""
+        for key, inflight in self._inflight.items():
+            if inflight is task:
+                del self._inflight[key]
+                return
+
+    async def _fetch_results(self, key: tuple[str, int]) -> list[Any]:
+        """Run one search and cache its results unless memories were stored meanwhile."""
+        query, limit = key
+        gen = self._cache_gen
+        response = await self.client.search.execute(q=query, limit=limit)
+        results = response.results[:limit] if response.results else []
+        if gen == self._cache_gen:
+            cache = self._search_cache
+            cache[key] = (time.monotonic(), results)
+            cache.move_to_end(key)
+            if len(cache) > _SEARCH_CACHE_SIZE:
+                cache.popitem(last=False)
+        return results
+
     async def get_context(self, limit: int = 10) -> str:
         """Retrieve relevant memories to inject as session context.
 
+        Results are capped server-side and reused for a short while, so quick
+        session restarts do not repeat the search.
+
         Args:
             limit: Maximum number of memories to retrieve.
 
@@ -40,33 +133,74 @@ class TutorMemory:
 
         """
         try:
-            response = await self.client.search.execute(
-                q="Learner name, personal information, learning progress, preferences, and recent sessions",
-            )
-            return self._format_context(response.results[:limit] if response.results else [])
+            return self._format_context(await self._search_results(_CONTEXT_QUERY, limit))
         except Exception as e:
             logger.warning("Failed to retrieve memory context: %s", e)
             return ""
 
     async def store(self, content: str, category: str = "conversation") -> None:
-        """Store a memory.
+        """Queue a memory for storage.
+
+        Returns without waiting for SuperMemory; a background task sends queued
+        memories so the conversation never blocks on the write.
 
         Args:
             content: The content to store.
             category: Category of the memory (conversation, progress, preference, struggle, success, personal).
 
         """
-        try:
-            # Include metadata in the content for searchability
-            formatted_content = f"[{category}] [user:{self.user_id}] {content}"
-            await self.client.memories.add(content=formatted_content)
-            logger.debug("Stored memory: %s", content[:50])
-        except Exception as e:
-            logger.warning("Failed to store memory: %s", e)
+        # Include metadata in the content for searchability
+        prefix = self._prefixes.get(category) or f"[{category}] [user:{self.user_id}] "
+        formatted_content = prefix + content
+        queue, writer = self._pending, self._writer
+        # (Re)start the writer if there is none yet, it died, or it belongs to an older event loop
+        if queue is None or writer is None or writer.done() or writer.get_loop() is not asyncio.get_running_loop():
+            queue = self._pending = asyncio.Queue()
+            self._writer = asyncio.create_task(self._drain_pending(queue), name="tutor-memory-writer")
+        queue.put_nowait(formatted_content)
+        self._invalidate_searches()
+
+    def _invalidate_searches(self) -> None:
+        """Drop cached search results, and stop in-flight searches from caching theirs."""
+        self._search_cache.clear()
+        self._cache_gen += 1
+
+    async def flush(self) -> None:
+        """Wait until every queued memory has been sent."""
+        if self._pending is not None and self._writer is not None and not self._writer.done():
+            await self._pending.join()
+
+    async def _drain_pending(self, queue: asyncio.Queue[str]) -> None:
+        """Send queued memories, taking whatever has piled up (up to a batch) per round."""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _STORE_BATCH and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                memories = self.client.memories
+                results: list[Any] = await asyncio.gather(
+                    *(memories.add(content=c) for c in batch),
+                    return_exceptions=True,
+                )
+            except Exception as e:
+                # Client creation failed; report it per memory rather than killing the writer
+                results = [e] * len(batch)
+            for content, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.warning("Failed to store memory: %s", result)
+                else:
+                    logger.debug("Stored memory: %s", content[:50])
+            # store() already invalidated; searches made while the batch was in flight cached stale results
+            self._invalidate_searches()
+            for _ in batch:
+                queue.task_done()
 
     async def search(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
         """Search memories by query.
 
+        Identical searches are answered from a short-lived cache until a new
+        memory is stored.
+
         Args:
             query: Search query.
             limit: Maximum number of results.
@@ -76,9 +210,8 @@ class TutorMemory:
 
         """
         try:
-            response = await self.client.search.execute(q=query)
-            results = response.results[:limit] if response.results else []
-            return [{"content": r.content if hasattr(r, "content") else str(r)} for r in results]
+            results = await self._search_results(query, limit)
+            return [{"content": _result_text(r)} for r in results]
         except Exception as e:
             logger.warning("Failed to search memories: %s", e)
             return []
@@ -87,18 +220,10 @@ class TutorMemory:
         """Format search results as context for the system prompt.
 
         Args:
-            results: Search results from SuperMemory.
+            results: Search results from SuperMemory (SDK ``Result`` models).
 
         Returns:
             Formatted context string.
 
         """
-        if not results:
-            return ""
-
-        lines = []
-        for r in results:
-            content = r.content if hasattr(r, "content") else str(r)
-            lines.append(f"- {content}")
-
-        return "\n".join(lines)
+        return "\n".join(f"- {_result_text(r)}" for r in results)
@@ -30,6 +30,9 @@ logger = logging.getLogger(__name__)
 OPEN_AI_INPUT_SAMPLE_RATE: Final[Literal[24000]] = 24000
 OPEN_AI_OUTPUT_SAMPLE_RATE: Final[Literal[24000]] = 24000
 
+# Voices discovered per realtime model name (filled on first successful lookup)
+_MODEL_VOICES_CACHE: dict[str, list[str]] = {}
+
 
 class OpenaiRealtimeHandler(AsyncStreamHandler):
     """An OpenAI realtime handler for fastrtc Stream."""
@@ -98,9 +101,7 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
             from reachy_mini_language_tutor.config import set_custom_profile
 
             set_custom_profile(profile)
-            logger.info(
-                "Set custom profile to %r (config=%r)", profile, getattr(_config, "REACHY_MINI_CUSTOM_PROFILE", None)
-            )
+            logger.info("Set custom profile to %r (config=%r)", profile, _config.REACHY_MINI_CUSTOM_PROFILE)
 
             try:
                 instructions = get_session_instructions()
@@ -296,7 +297,7 @@ The following is what you remember about this learner from previous sessions:
                 )
                 logger.info(
                     "Realtime session initialized with profile=%r voice=%r language=%r",
-                    getattr(config, "REACHY_MINI_CUSTOM_PROFILE", None),
+                    config.REACHY_MINI_CUSTOM_PROFILE,
                     get_session_voice(),
                     get_session_language(),
                 )
@@ -684,6 +685,13 @@ The following is what you remember about this learner from previous sessions:
             finally:
                 self.connection = None
 
+        # Let queued memories reach SuperMemory before the loop goes away
+        if self.deps and self.deps.memory_manager:
+            try:
+                await asyncio.wait_for(self.deps.memory_manager.flush(), timeout=5.0)
+            except Exception as e:
+                logger.warning("Memory flush on shutdown failed: %s", e)
+
         # Clear any remaining items in the output queue
         while not self.output_queue.empty():
             try:
@@ -703,8 +711,14 @@ The following is what you remember about this learner from previous sessions:
 
         Attempts to retrieve model metadata from the OpenAI Models API and look
         for any keys that might contain voice names. Falls back to a curated
-        list known to work with realtime if discovery fails.
+        list known to work with realtime if discovery fails. Successful
+        discoveries are cached per model name for the lifetime of the process.
         """
+        model_name = config.MODEL_NAME
+        cached = _MODEL_VOICES_CACHE.get(model_name)
+        if cached is not None:
+            return list(cached)
+
         # Conservative fallback list with default first
         fallback = [
             "cedar",
@@ -717,7 +731,7 @@ The following is what you remember about this learner from previous sessions:
         ]
         try:
             # Best effort discovery; safe-guarded for unexpected shapes
-            model = await self.client.models.retrieve(config.MODEL_NAME)
+            model = await self.client.models.retrieve(model_name)
             # Try common serialization paths
             raw = None
             for attr in ("model_dump", "to_dict"):
@@ -761,7 +775,8 @@ The following is what you remember about this learner from previous sessions:
             voices = sorted(candidates) if candidates else fallback
             if "cedar" not in voices:
                 voices = ["cedar", *[v for v in voices if v != "cedar"]]
-            return voices
+            _MODEL_VOICES_CACHE[model_name] = voices
+            return list(voices)
         except Exception:
             return fallback
 
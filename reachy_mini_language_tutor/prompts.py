@@ -2,6 +2,7 @@ import re
 import sys
 import logging
 from pathlib import Path
+from functools import lru_cache
 
 from reachy_mini_language_tutor.config import config
 
@@ -17,6 +18,42 @@ LANGUAGE_FILENAME = "language.txt"
 PROACTIVE_FILENAME = "proactive.txt"
 
 
+# A line holding only [<name>], where name is a file stem (alphanumeric, underscores, hyphens)
+# and may include slashes for subdirectories; surrounding spaces on the line are ignored
+_PLACEHOLDER_RE = re.compile(r"^[^\S\n]*\[([a-zA-Z0-9/_-]+)\][^\S\n]*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=64)
+def _read_prompt_template(template_name: str) -> str:
+    """Read a prompts library file once per process, without trailing whitespace.
+
+    Failures raise, and lru_cache does not cache exceptions, so a failed read is retried next time.
+    """
+    return (PROMPTS_LIBRARY_DIRECTORY / f"{template_name}.txt").read_text(encoding="utf-8").rstrip()
+
+
+def _load_prompt_template(template_name: str) -> str | None:
+    """Return a prompts library file's content, or None if it is missing or unreadable."""
+    try:
+        return _read_prompt_template(template_name)
+    except FileNotFoundError:
+        logger.warning(
+            "Template file not found: %s, keeping placeholder", PROMPTS_LIBRARY_DIRECTORY / f"{template_name}.txt"
+        )
+    except Exception as e:
+        logger.warning("Failed to read template '%s': %s, keeping placeholder", template_name, e)
+    return None
+
+
+def _expand_placeholder(match: re.Match[str]) -> str:
+    """Return the library content for one placeholder line, or the line unchanged."""
+    template_content = _load_prompt_template(match.group(1))
+    if template_content is None:
+        return match.group(0)
+    logger.debug("Expanded template: [%s]", match.group(1))
+    return template_content
+
+
 def _expand_prompt_includes(content: str) -> str:
     """Expand [<name>] placeholders with content from prompts library files.
 
@@ -27,38 +64,7 @@ def _expand_prompt_includes(content: str) -> str:
         Expanded content with placeholders replaced by file contents
 
     """
-    # Pattern to match [<name>] where name is a valid file stem (alphanumeric, underscores, hyphens)
-    # pattern = re.compile(r'^\[([a-zA-Z0-9_-]+)\]$')
-    # Allow slashes for subdirectories
-    pattern = re.compile(r"^\[([a-zA-Z0-9/_-]+)\]$")
-
-    lines = content.split("\n")
-    expanded_lines = []
-
-    for line in lines:
-        stripped = line.strip()
-        match = pattern.match(stripped)
-
-        if match:
-            # Extract the name from [<name>]
-            template_name = match.group(1)
-            template_file = PROMPTS_LIBRARY_DIRECTORY / f"{template_name}.txt"
-
-            try:
-                if template_file.exists():
-                    template_content = template_file.read_text(encoding="utf-8").rstrip()
-                    expanded_lines.append(template_content)
-                    logger.debug("Expanded template: [%s]", template_name)
-                else:
-                    logger.warning("Template file not found: %s, keeping placeholder", template_file)
-                    expanded_lines.append(line)
-            except Exception as e:
-                logger.warning("Failed to read template '%s': %s, keeping placeholder", template_name, e)
-                expanded_lines.append(line)
-        else:
-            expanded_lines.append(line)
-
-    return "\n".join(expanded_lines)
+    return _PLACEHOLDER_RE.sub(_expand_placeholder, content)
 
 
 def get_session_instructions() -> str:
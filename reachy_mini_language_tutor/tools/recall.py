@@ -42,7 +42,7 @@ class RecallTool(Tool):
         if not deps.memory_manager:
             return {"error": "Memory not available", "memories": []}
 
-        query = kwargs.get("query", "")
+        query = str(kwargs.get("query") or "").strip()
         if not query:
             return {"error": "No query provided", "memories": []}
 
@@ -53,11 +53,11 @@ class RememberTool(Tool):
         if not deps.memory_manager:
             return {"error": "Memory not available", "stored": False}
 
-        fact = kwargs.get("fact", "")
-        category = kwargs.get("category", "progress")
-
+        fact = str(kwargs.get("fact") or "").strip()
         if not fact:
             return {"error": "No fact provided", "stored": False}
 
+        category = kwargs.get("category", "progress")
+
         await deps.memory_manager.store(fact, category)
         return {"stored": True, "fact": fact, "category": category}
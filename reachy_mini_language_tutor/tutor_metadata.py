@@ -0,0 +1,47 @@
+"""Tutor display metadata shared by the tutor selector and the admin UI."""
+
+from __future__ import annotations
+import os
+import json
+import logging
+from typing import Any
+from pathlib import Path
+from functools import lru_cache
+from importlib import resources
+
+
+logger = logging.getLogger(__name__)
+
+# Per-profile display metadata (name, flag, colours), editable next to the package
+METADATA_PATH = Path(__file__).parent / "profile_metadata.json"
+
+
+@lru_cache(maxsize=1)
+def load_default_metadata() -> dict[str, Any]:
+    """Load the bundled fallback tutor metadata, used when profile_metadata.json is missing or invalid."""
+    raw = resources.files("reachy_mini_language_tutor").joinpath("profile_metadata_defaults.json").read_bytes()
+    data: dict[str, Any] = json.loads(raw)
+    return data
+
+
+def load_metadata(path_str: str) -> dict[str, Any]:
+    """Load tutor metadata from JSON file, parsing it again only when the file changes.
+
+    The returned dict is shared by every caller and must not be mutated.
+    """
+    try:
+        mtime_ns = os.stat(path_str).st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    return _parse_metadata(path_str, mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _parse_metadata(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse the metadata file; the modification time is only part of the cache key."""
+    try:
+        data: dict[str, Any] = json.loads(Path(path_str).read_bytes())
+        return data
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not load tutor metadata: {e}, using defaults")
+        return load_default_metadata()
@@ -0,0 +1,147 @@
+import os
+import logging
+from typing import Any, Iterator
+from pathlib import Path
+
+import pytest
+
+import reachy_mini_language_tutor.config as config_mod
+from reachy_mini_language_tutor.config import config, set_custom_profile, apply_config_updates
+
+
+@pytest.fixture
+def fresh_dotenv_load(monkeypatch: Any) -> Iterator[None]:
+    """Let a test run the once-per-process .env load again, then forget its result."""
+    monkeypatch.delenv("REACHY_SKIP_DOTENV", raising=False)
+    monkeypatch.delenv("REACHY_DOTENV_PATH", raising=False)
+    config_mod._load_dotenv_once.cache_clear()
+    yield
+    config_mod._load_dotenv_once.cache_clear()
+
+
+@pytest.mark.parametrize("raw", ["true", "TRUE", "1", "yes", "on", " On "])
+def test_env_bool_accepts_true_spellings(monkeypatch: Any, raw: str) -> None:
+    """Any of the accepted spellings reads as True."""
+    monkeypatch.setattr(config_mod, "_env", {"FLAG": raw})
+    assert config_mod._env_bool("FLAG", False) is True
+
+
+def test_env_bool_false_and_default(monkeypatch: Any) -> None:
+    """Other values read as False; an unset variable returns the default."""
+    monkeypatch.setattr(config_mod, "_env", {"FLAG": "0"})
+    assert config_mod._env_bool("FLAG", True) is False
+    assert config_mod._env_bool("MISSING", True) is True
+
+
+def test_env_int_falls_back_on_malformed_value(monkeypatch: Any, caplog: Any) -> None:
+    """A malformed integer logs a warning and yields the default."""
+    monkeypatch.setattr(config_mod, "_env", {"TIMEOUT": "abc"})
+    with caplog.at_level(logging.WARNING):
+        assert config_mod._env_int("TIMEOUT", 300) == 300
+    assert "TIMEOUT" in caplog.text
+
+
+def test_find_dotenv_checks_cwd_then_project_root_without_walking_up(monkeypatch: Any, tmp_path: Path) -> None:
+    """The lookup tries the cwd and the project root only, never parent directories."""
+    monkeypatch.delenv("REACHY_DOTENV_PATH", raising=False)
+    root = tmp_path / "root"
+    cwd = tmp_path / "parent" / "cwd"
+    root.mkdir()
+    cwd.mkdir(parents=True)
+    (tmp_path / "parent" / ".env").write_text("")
+    monkeypatch.setattr(config_mod, "PROJECT_ROOT", root)
+    monkeypatch.chdir(cwd)
+
+    assert config_mod._find_dotenv_path() is None
+
+    (root / ".env").write_text("")
+    assert config_mod._find_dotenv_path() == str(root / ".env")
+
+    (cwd / ".env").write_text("")
+    assert config_mod._find_dotenv_path() == str(cwd / ".env")
+
+
+def test_find_dotenv_explicit_path_replaces_the_search(monkeypatch: Any, tmp_path: Path) -> None:
+    """REACHY_DOTENV_PATH is used on its own, without falling back to the default locations."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text("")
+    custom = tmp_path / "custom.env"
+    monkeypatch.setenv("REACHY_DOTENV_PATH", str(custom))
+
+    assert config_mod._find_dotenv_path() is None
+
+    custom.write_text("")
+    assert config_mod._find_dotenv_path() == str(custom)
+
+
+@pytest.mark.usefixtures("fresh_dotenv_load")
+def test_shell_variables_take_precedence_over_dotenv(monkeypatch: Any, tmp_path: Path) -> None:
+    """Variables already set in the environment are not overridden by the .env file."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("REACHY_TEST_SHELL=from-file\nREACHY_TEST_FILE_ONLY=from-file\n")
+    monkeypatch.setenv("REACHY_DOTENV_PATH", str(env_file))
+    monkeypatch.setenv("REACHY_TEST_SHELL", "from-shell")
+    monkeypatch.delenv("REACHY_TEST_FILE_ONLY", raising=False)
+
+    assert config_mod._load_dotenv_once() == str(env_file)
+    assert os.environ["REACHY_TEST_SHELL"] == "from-shell"
+    assert os.environ["REACHY_TEST_FILE_ONLY"] == "from-file"
+
+
+@pytest.mark.usefixtures("fresh_dotenv_load")
+@pytest.mark.parametrize(("flag", "skipped"), [("1", True), ("true", True), ("0", False), ("false", False)])
+def test_skip_dotenv_flag_is_parsed_as_boolean(monkeypatch: Any, tmp_path: Path, flag: str, skipped: bool) -> None:
+    """REACHY_SKIP_DOTENV skips the file only for true values."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("REACHY_TEST_FILE_ONLY=from-file\n")
+    monkeypatch.setenv("REACHY_DOTENV_PATH", str(env_file))
+    monkeypatch.setenv("REACHY_SKIP_DOTENV", flag)
+    monkeypatch.delenv("REACHY_TEST_FILE_ONLY", raising=False)
+
+    loaded = config_mod._load_dotenv_once()
+
+    assert (loaded is None) is skipped
+    assert ("REACHY_TEST_FILE_ONLY" in os.environ) is not skipped
+
+
+def test_apply_config_updates_mirrors_into_environ(monkeypatch: Any) -> None:
+    """Updates set config fields and os.environ; booleans are lowercased, None removes the variable."""
+    for name in ("ENABLE_IDLE_SIGNALS", "IDLE_SIGNAL_TIMEOUT", "SUPERMEMORY_API_KEY"):
+        monkeypatch.setattr(config, name, getattr(config, name))
+    monkeypatch.setenv("SUPERMEMORY_API_KEY", "sm-old")
+    monkeypatch.delenv("ENABLE_IDLE_SIGNALS", raising=False)
+    monkeypatch.delenv("IDLE_SIGNAL_TIMEOUT", raising=False)
+
+    apply_config_updates({"ENABLE_IDLE_SIGNALS": False, "IDLE_SIGNAL_TIMEOUT": 120, "SUPERMEMORY_API_KEY": None})
+
+    assert config.ENABLE_IDLE_SIGNALS is False
+    assert config.IDLE_SIGNAL_TIMEOUT == 120
+    assert config.SUPERMEMORY_API_KEY is None
+    assert os.environ["ENABLE_IDLE_SIGNALS"] == "false"
+    assert os.environ["IDLE_SIGNAL_TIMEOUT"] == "120"
+    assert "SUPERMEMORY_API_KEY" not in os.environ
+
+
+def test_set_custom_profile_strips_and_clears(monkeypatch: Any) -> None:
+    """Profile names are stripped; a blank name selects the default and clears the variable."""
+    monkeypatch.setattr(config, "REACHY_MINI_CUSTOM_PROFILE", config.REACHY_MINI_CUSTOM_PROFILE)
+    monkeypatch.delenv("REACHY_MINI_CUSTOM_PROFILE", raising=False)
+
+    set_custom_profile("  french_tutor ")
+    assert config.REACHY_MINI_CUSTOM_PROFILE == "french_tutor"
+    assert os.environ["REACHY_MINI_CUSTOM_PROFILE"] == "french_tutor"
+
+    set_custom_profile("   ")
+    assert config.REACHY_MINI_CUSTOM_PROFILE is None
+    assert "REACHY_MINI_CUSTOM_PROFILE" not in os.environ
+
+
+def test_set_custom_profile_ignores_non_strings(monkeypatch: Any, caplog: Any) -> None:
+    """A non-string profile is logged and leaves the current selection alone."""
+    monkeypatch.setattr(config, "REACHY_MINI_CUSTOM_PROFILE", "spanish_tutor")
+
+    with caplog.at_level(logging.WARNING):
+        set_custom_profile(42)  # type: ignore[arg-type]
+
+    assert config.REACHY_MINI_CUSTOM_PROFILE == "spanish_tutor"
+    assert "Ignoring non-string profile" in caplog.text
@@ -0,0 +1,34 @@
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from reachy_mini_language_tutor.env_file import update_env_lines, persist_env_updates
+
+
+def test_update_env_lines_replaces_appends_and_removes() -> None:
+    """Keys replace their first assignment, new keys are appended, None removes the line."""
+    lines = ["# comment", "export OPENAI_API_KEY=old", "REACHY_MINI_CUSTOM_PROFILE=french_tutor"]
+
+    changed = update_env_lines(
+        lines, {"OPENAI_API_KEY": "new", "REACHY_MINI_CUSTOM_PROFILE": None, "IDLE_SIGNAL_TIMEOUT": "120"}
+    )
+
+    assert changed
+    assert lines == ["# comment", "OPENAI_API_KEY=new", "IDLE_SIGNAL_TIMEOUT=120"]
+    assert not update_env_lines(lines, {"OPENAI_API_KEY": "new"})
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_persist_env_updates_writes_atomically_with_same_mode(tmp_path: Path) -> None:
+    """The file is swapped in without leftovers and keeps its permissions."""
+    env_path = tmp_path / ".env"
+    env_path.write_text("OPENAI_API_KEY=sk-test\n")
+    env_path.chmod(0o600)
+
+    assert persist_env_updates(env_path, ["OPENAI_API_KEY=sk-test"], {"SUPERMEMORY_API_KEY": "sm-test"})
+
+    assert env_path.read_text() == "OPENAI_API_KEY=sk-test\nSUPERMEMORY_API_KEY=sm-test\n"
+    assert stat.S_IMODE(env_path.stat().st_mode) == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == [".env"]
@@ -0,0 +1,37 @@
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from reachy_mini_language_tutor.gradio_admin import GradioAdminUI
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_env_save_keeps_file_mode(tmp_path: Path) -> None:
+    """Saving a setting rewrites .env atomically without widening its permissions."""
+    env_path = tmp_path / ".env"
+    env_path.write_text("OPENAI_API_KEY=sk-test\nIDLE_SIGNAL_TIMEOUT=300\n")
+    env_path.chmod(0o600)
+
+    GradioAdminUI(instance_path=str(tmp_path))._persist_env_values({"IDLE_SIGNAL_TIMEOUT": "120"})
+
+    assert stat.S_IMODE(env_path.stat().st_mode) == 0o600
+    assert env_path.read_text() == "OPENAI_API_KEY=sk-test\nIDLE_SIGNAL_TIMEOUT=120\n"
+    assert [p.name for p in tmp_path.iterdir()] == [".env"]
+
+
+def test_env_save_keeps_external_edits(tmp_path: Path) -> None:
+    """Lines added to .env outside the UI survive the next save."""
+    env_path = tmp_path / ".env"
+    env_path.write_text("OPENAI_API_KEY=sk-test\n")
+    ui = GradioAdminUI(instance_path=str(tmp_path))
+    ui._persist_env_values({"IDLE_SIGNAL_TIMEOUT": "120"})
+
+    with env_path.open("a") as f:
+        f.write("SUPERMEMORY_API_KEY=sm-test\n")
+    ui._persist_env_values({"ENABLE_IDLE_SIGNALS": "false"})
+
+    assert env_path.read_text() == (
+        "OPENAI_API_KEY=sk-test\nIDLE_SIGNAL_TIMEOUT=120\nSUPERMEMORY_API_KEY=sm-test\nENABLE_IDLE_SIGNALS=false\n"
+    )
@@ -136,3 +136,25 @@ async def test_start_up_retries_on_abrupt_close(monkeypatch: Any, caplog: Any) -
     # Optional: confirm we logged the unexpected close once
     warnings = [r for r in caplog.records if r.levelname == "WARNING" and "closed unexpectedly" in r.msg]
     assert len(warnings) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_available_voices_cached_per_model(monkeypatch: Any) -> None:
+    """Voice discovery hits the Models API once per model name."""
+    monkeypatch.setattr(rt_mod, "_MODEL_VOICES_CACHE", {})
+    calls = {"n": 0}
+
+    class FakeModels:
+        async def retrieve(self, _name: str) -> Any:
+            calls["n"] += 1
+            return {"voices": ["verse", "alloy"]}
+
+    deps = ToolDependencies(reachy_mini=MagicMock(), movement_manager=MagicMock())
+    handler = rt_mod.OpenaiRealtimeHandler(deps)
+    handler.client = MagicMock(models=FakeModels())
+
+    first = await handler.get_available_voices()
+    second = await handler.get_available_voices()
+
+    assert first == second == ["cedar", "alloy", "verse"]
+    assert calls["n"] == 1
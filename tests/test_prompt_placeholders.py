@@ -1,7 +1,11 @@
 """Tests for prompt placeholder expansion in language tutor profiles."""
 
+from typing import Any
+from pathlib import Path
+
 import pytest
 
+import reachy_mini_language_tutor.prompts as prompts_mod
 from reachy_mini_language_tutor.prompts import (
     PROFILES_DIRECTORY,
     PROMPTS_LIBRARY_DIRECTORY,
@@ -9,6 +13,18 @@ from reachy_mini_language_tutor.prompts import (
 )
 
 
+TUTORS = ("french_tutor", "spanish_tutor", "german_tutor", "italian_tutor", "portuguese_tutor")
+
+
+@pytest.fixture(scope="session")
+def expanded_instructions() -> dict[str, str]:
+    """Expand each tutor's instructions once and share the result across tests."""
+    return {
+        tutor: _expand_prompt_includes((PROFILES_DIRECTORY / tutor / "instructions.txt").read_text(encoding="utf-8"))
+        for tutor in TUTORS
+    }
+
+
 class TestPlaceholderExpansion:
     """Test placeholder expansion for shared language tutoring prompts."""
 
@@ -56,6 +72,27 @@ class TestPlaceholderExpansion:
         assert "## PROACTIVE ENGAGEMENT" in expanded
         assert "## LANGUAGE BEHAVIOR" in expanded
 
+    def test_indented_placeholder_expands_and_inline_is_kept(self):
+        """Placeholders alone on a line expand even when indented; inline ones are left alone."""
+        content = "  [language_tutoring/final_notes]\t\nSee [language_tutoring/final_notes] above"
+        expanded = _expand_prompt_includes(content)
+
+        first, _, last = expanded.rpartition("\n")
+        assert first.startswith("## FINAL NOTES")
+        assert last == "See [language_tutoring/final_notes] above"
+
+    def test_failed_template_read_is_retried(self, monkeypatch: Any, tmp_path: Path):
+        """A placeholder that could not be read expands once the file becomes readable."""
+        monkeypatch.setattr(prompts_mod, "PROMPTS_LIBRARY_DIRECTORY", tmp_path)
+        prompts_mod._read_prompt_template.cache_clear()
+        try:
+            assert _expand_prompt_includes("[flaky]") == "[flaky]"
+
+            (tmp_path / "flaky.txt").write_text("Recovered\n", encoding="utf-8")
+            assert _expand_prompt_includes("[flaky]") == "Recovered"
+        finally:
+            prompts_mod._read_prompt_template.cache_clear()
+
     def test_invalid_placeholder_kept(self):
         """Test that invalid placeholders are kept as-is."""
         content = "[nonexistent_placeholder]"
@@ -63,23 +100,10 @@ class TestPlaceholderExpansion:
 
         assert "[nonexistent_placeholder]" in expanded
 
-    @pytest.mark.parametrize(
-        "tutor",
-        [
-            "french_tutor",
-            "spanish_tutor",
-            "german_tutor",
-            "italian_tutor",
-            "portuguese_tutor",
-        ],
-    )
-    def test_tutor_profile_expands_successfully(self, tutor: str):
+    @pytest.mark.parametrize("tutor", TUTORS)
+    def test_tutor_profile_expands_successfully(self, tutor: str, expanded_instructions: dict[str, str]):
         """Test that each tutor profile expands without unexpanded placeholders."""
-        instructions_file = PROFILES_DIRECTORY / tutor / "instructions.txt"
-        assert instructions_file.exists(), f"Missing instructions file for {tutor}"
-
-        instructions = instructions_file.read_text(encoding="utf-8")
-        expanded = _expand_prompt_includes(instructions)
+        expanded = expanded_instructions[tutor]
 
         # Verify no unexpanded language_tutoring placeholders remain
         assert "[language_tutoring/" not in expanded, f"Unexpanded placeholders found in {tutor}"
@@ -103,11 +127,9 @@ class TestPlaceholderExpansion:
             ("portuguese_tutor", "Rafael"),
         ],
     )
-    def test_tutor_identity_preserved(self, tutor: str, expected_identity: str):
+    def test_tutor_identity_preserved(self, tutor: str, expected_identity: str, expanded_instructions: dict[str, str]):
         """Test that unique tutor identities are preserved after expansion."""
-        instructions_file = PROFILES_DIRECTORY / tutor / "instructions.txt"
-        instructions = instructions_file.read_text(encoding="utf-8")
-        expanded = _expand_prompt_includes(instructions)
+        expanded = expanded_instructions[tutor]
 
         assert expected_identity in expanded, f"Tutor identity '{expected_identity}' missing in {tutor}"
 
@@ -120,11 +142,11 @@ class TestPlaceholderExpansion:
             ("portuguese_tutor", "BRAZILIAN PORTUGUESE SPECIFICS"),
         ],
     )
-    def test_language_specific_sections_preserved(self, tutor: str, language_specific_section: str):
+    def test_language_specific_sections_preserved(
+        self, tutor: str, language_specific_section: str, expanded_instructions: dict[str, str]
+    ):
         """Test that language-specific teaching sections are preserved."""
-        instructions_file = PROFILES_DIRECTORY / tutor / "instructions.txt"
-        instructions = instructions_file.read_text(encoding="utf-8")
-        expanded = _expand_prompt_includes(instructions)
+        expanded = expanded_instructions[tutor]
 
         assert language_specific_section in expanded, (
             f"Language-specific section '{language_specific_section}' missing in {tutor}"
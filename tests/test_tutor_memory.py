@@ -0,0 +1,110 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from reachy_mini_language_tutor.memory import TutorMemory
+
+
+class FakeSearch:
+    """Records search calls and returns canned results."""
+
+    def __init__(self) -> None:
+        """Start with no recorded calls."""
+        self.calls: list[dict[str, Any]] = []
+
+    async def execute(self, **kwargs: Any) -> Any:
+        """Record the call and return one result shaped like the SDK's (no full document requested)."""
+        self.calls.append(kwargs)
+        chunk = SimpleNamespace(content="Likes cycling")
+        return SimpleNamespace(results=[SimpleNamespace(content=None, summary=None, chunks=[chunk])])
+
+
+class FakeMemories:
+    """Records stored contents."""
+
+    def __init__(self) -> None:
+        """Start with nothing stored."""
+        self.added: list[str] = []
+
+    async def add(self, *, content: str) -> None:
+        """Record the stored content."""
+        self.added.append(content)
+
+
+def _build_memory() -> tuple[TutorMemory, FakeSearch, FakeMemories]:
+    memory = TutorMemory("sm-test", profile_name="french_tutor")
+    search = FakeSearch()
+    memories = FakeMemories()
+    memory._client = SimpleNamespace(search=search, memories=memories)  # type: ignore[assignment]
+    return memory, search, memories
+
+
+@pytest.mark.asyncio
+async def test_get_context_passes_limit_and_reuses_result() -> None:
+    """Context is capped server-side and cached until a new memory is stored."""
+    memory, search, _ = _build_memory()
+
+    first = await memory.get_context(limit=3)
+    second = await memory.get_context(limit=3)
+
+    assert first == second == "- Likes cycling"
+    assert len(search.calls) == 1
+    assert search.calls[0]["limit"] == 3
+
+    await memory.store("Struggles with the subjunctive", "struggle")
+    await memory.flush()
+    await memory.get_context(limit=3)
+    assert len(search.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_store_is_written_behind() -> None:
+    """store() returns before the write; flush() waits for every queued memory."""
+    memory, _, memories = _build_memory()
+
+    await memory.store("Name is Alex", "personal")
+    await memory.store("Enjoys cooking", "preference")
+    assert memories.added == []
+
+    await memory.flush()
+    assert memories.added == [
+        "[personal] [user:french_tutor_learner] Name is Alex",
+        "[preference] [user:french_tutor_learner] Enjoys cooking",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_reuses_results_per_query_and_limit() -> None:
+    """Identical searches share one request; a different limit is a separate entry."""
+    memory, search, _ = _build_memory()
+
+    assert await memory.search("hobbies") == [{"content": "Likes cycling"}]
+    await memory.search("hobbies")
+    await memory.search("hobbies", limit=2)
+
+    assert [(c["q"], c["limit"]) for c in search.calls] == [("hobbies", 5), ("hobbies", 2)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_request() -> None:
+    """Searches racing for the same key are coalesced into a single call."""
+    memory, search, _ = _build_memory()
+
+    first, second = await asyncio.gather(memory.search("hobbies"), memory.search("hobbies"))
+
+    assert first == second == [{"content": "Likes cycling"}]
+    assert len(search.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_store_invalidates_cached_searches_immediately() -> None:
+    """A search right after store() is not answered from the pre-store cache."""
+    memory, search, _ = _build_memory()
+
+    await memory.search("hobbies")
+    await memory.store("Took up climbing", "personal")
+    await memory.search("hobbies")
+
+    assert len(search.calls) == 2